@@ -0,0 +1,228 @@
+"""Headless batch export of current observations.
+
+Fetches one or more regions with the same station catalog and fetcher the
+map uses, and streams one row per station to CSV, JSON Lines or Parquet
+(needs ``pyarrow``). A station listed in several of the selected regions
+is fetched and written once, with all of them in its ``regions`` column
+(``;`` separated). No Bokeh server is involved, so it can run from cron::
+
+    python batch.py europe greece -o snapshot.csv
+    python batch.py all --format jsonl -o - | gzip > snapshot.jsonl.gz
+    */30 * * * * cd /app && python batch.py all -o /data/obs-$(date +\%H\%M).parquet
+
+Stations are fetched and written ``--chunk-size`` at a time, so memory stays
+flat however many stations a region has. Requests are paced to
+``CYCLOPS_REQUEST_BUDGET`` per minute. Files are written under a temporary
+name and renamed when complete, so readers never see half a snapshot.
+The exit status is 1 when no station could be fetched at all.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import wait
+from datetime import datetime, timezone
+
+import numpy as np
+
+from fetcher import MAX_CONCURRENCY, FetchEngine
+from regions import region_keys, station_catalog
+from scheduler import BURST_S, REQUEST_BUDGET_PER_MIN, TokenBucket
+
+FIELDS = ["fetched_at", "observed_at", "regions", "id", "name", "lat", "lon", "temp", "humidity", "pressure", "cloud"]
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+CHUNK_SIZE = 500
+
+
+class ChunkCollector:
+    """Takes the place of the shared cache for the fetch engine.
+
+    Holds observations only until the current chunk has been written.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.obs = {}
+
+    def put(self, key, obs):
+        with self._lock:
+            self.obs[key] = (time.time(), obs)
+
+    def drain(self):
+        with self._lock:
+            obs, self.obs = self.obs, {}
+        return obs
+
+
+# -- Writers: write(rows) per chunk, close() once
+class CsvWriter:
+    def __init__(self, f):
+        self.f = f
+        self.writer = csv.DictWriter(f, fieldnames=FIELDS)
+        self.writer.writeheader()
+
+    def write(self, rows):
+        for row in rows:
+            self.writer.writerow({k: "" if _missing(v) else _text(v) for k, v in row.items()})
+
+    def close(self):
+        self.f.flush()
+
+
+class JsonLinesWriter:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, rows):
+        for row in rows:
+            self.f.write(json.dumps({k: None if _missing(v) else _text(v) for k, v in row.items()},
+                                    ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.f.flush()
+
+
+class ParquetWriter:
+    def __init__(self, f):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        self.pa = pa
+        self.schema = pa.schema([
+            ("fetched_at", pa.timestamp("s", tz="UTC")), ("observed_at", pa.timestamp("s", tz="UTC")),
+            ("regions", pa.string()), ("id", pa.string()),
+            ("name", pa.string()), ("lat", pa.float64()), ("lon", pa.float64()), ("temp", pa.float64()),
+            ("humidity", pa.float64()), ("pressure", pa.float64()), ("cloud", pa.float64()),
+        ])
+        self.writer = pq.ParquetWriter(f, self.schema)
+
+    def write(self, rows):
+        # One row group per chunk
+        rows = [{k: None if _missing(v) else v for k, v in row.items()} for row in rows]
+        self.writer.write_table(self.pa.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {"csv": (CsvWriter, "w"), "jsonl": (JsonLinesWriter, "w"), "parquet": (ParquetWriter, "wb")}
+
+
+def _missing(v):
+    return v is None or (isinstance(v, float) and math.isnan(v))
+
+
+def _utc(t):
+    return None if _missing(t) else datetime.fromtimestamp(t, timezone.utc).replace(microsecond=0)
+
+
+def _text(v):
+    return v.isoformat() if isinstance(v, datetime) else v
+
+
+def fetch_chunk(engine, bucket, stations):
+    """Fetch ``(key, city)`` pairs, one request per token from ``bucket``."""
+    futures = []
+    for batch in engine.plan(stations):
+        while not bucket.take():
+            time.sleep(0.05)
+        fut = engine.submit_batch(batch)
+        if fut is not None:
+            futures.append(fut)
+    wait(futures)
+
+
+def export(regions, writer, chunk_size=CHUNK_SIZE, budget_per_min=REQUEST_BUDGET_PER_MIN,
+           max_workers=MAX_CONCURRENCY, log=None):
+    """Fetch every station of ``regions`` once and hand rows to ``writer`` chunk by chunk.
+
+    Returns ``(rows written, rows without an observation)``.
+    """
+    catalog = station_catalog()
+    collector = ChunkCollector()
+    engine = FetchEngine(max_workers=max_workers, cache=collector)
+    rate = budget_per_min / 60.0
+    bucket = TokenBucket(rate, max(1.0, rate * BURST_S))
+    written = missing = 0
+    selected = [r for r in catalog.region_names if r in set(regions)]
+    rows = np.flatnonzero(catalog.region_mask & catalog.regions_mask(selected))
+    try:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            stations = [(catalog.ids[i], catalog.station(catalog.ids[i])) for i in chunk]
+            fetch_chunk(engine, bucket, stations)
+            obs = collector.drain()
+            out = []
+            for key, city in stations:
+                fetched_at, o = obs.get(key, (None, {}))
+                out.append(dict(
+                    fetched_at=_utc(fetched_at), observed_at=_utc(o.get("dt")),
+                    regions=";".join(r for r in catalog.station_regions(key) if r in selected),
+                    id=key, name=city["name"], lat=city["lat"], lon=city["lon"],
+                    temp=o.get("temp"), humidity=o.get("humidity"),
+                    pressure=o.get("pressure"), cloud=o.get("cloud"),
+                ))
+                missing += key not in obs
+            writer.write(out)
+            written += len(out)
+            if log:
+                log(f"{min(start + chunk_size, len(rows))}/{len(rows)} stations")
+    finally:
+        engine.executor.shutdown(wait=False, cancel_futures=True)
+    return written, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot current observations of one or more regions to a file.")
+    parser.add_argument("regions", nargs="*", default=["all"], metavar="REGION",
+                        help=f"region keys ({', '.join(region_keys)}) or 'all' (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="default: from the output file extension, else csv")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="stations fetched and written at a time")
+    parser.add_argument("--budget", type=float, default=REQUEST_BUDGET_PER_MIN, help="API calls per minute")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="parallel API calls")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    args = parser.parse_args(argv)
+
+    regions = region_keys if "all" in args.regions else args.regions
+    unknown = [r for r in regions if r not in region_keys]
+    if unknown:
+        parser.error(f"unknown region(s): {', '.join(unknown)}")
+    fmt = args.format or FORMATS.get(os.path.splitext(args.output)[1].lower(), "csv")
+    writer_cls, mode = WRITERS[fmt]
+    log = None if args.quiet else (lambda msg: print(msg, file=sys.stderr))
+
+    t0 = time.perf_counter()
+    if args.output == "-":
+        f = sys.stdout.buffer if mode == "wb" else sys.stdout
+        writer = writer_cls(f)
+        written, missing = export(regions, writer, args.chunk_size, args.budget, args.concurrency, log)
+        writer.close()
+    else:
+        tmp = f"{args.output}.tmp{os.getpid()}"
+        try:
+            with open(tmp, mode, **({} if mode == "wb" else {"newline": "", "encoding": "utf-8"})) as f:
+                writer = writer_cls(f)
+                written, missing = export(regions, writer, args.chunk_size, args.budget, args.concurrency, log)
+                writer.close()
+            os.replace(tmp, args.output)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    if log:
+        log(f"{written} rows ({missing} without data) in {time.perf_counter() - t0:.1f}s -> {args.output}")
+    return 1 if written and missing == written else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:  # e.g. piped into head
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
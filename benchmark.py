@@ -0,0 +1,263 @@
+"""Offline benchmark suite.
+
+Starts ``owm_stub`` in-process (with configurable latency, jitter, error rate
+and rate limit), builds Cyclops sessions against it the way ``bokeh serve``
+would, and measures:
+
+* ``fetch``: ``fetch_and_update`` throughput from a cold cache - calls,
+  call latency, and observations landing in the cache per second;
+* ``regions``: ``region_callback`` latency for every entry in
+  ``region_keys``, the source bytes the switch pushed to the browser, and
+  the serialized size of ``source`` after it (with client-side regions,
+  ``CYCLOPS_CLIENT_REGIONS``, that is the whole catalog, sent once);
+* ``memory``: Python heap allocated per additional session (tracemalloc).
+
+Results are written as JSON so runs can be compared::
+
+    python benchmark.py --latency 0.05 --jitter 0.05 --out before.json
+    # ...change something...
+    python benchmark.py --latency 0.05 --jitter 0.05 --out after.json --compare before.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import owm_stub
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "Cyclops.py")
+
+
+def _ms(seconds):
+    return round(seconds * 1000.0, 3)
+
+
+def _summary_ms(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {}
+    return dict(
+        n=len(samples), mean=_ms(statistics.fmean(samples)), median=_ms(statistics.median(samples)),
+        p95=_ms(samples[min(len(samples) - 1, int(0.95 * len(samples)))]), max=_ms(samples[-1]),
+    )
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def new_session(app):
+    """Build one session document; returns the Cyclops script namespace."""
+    from bokeh.document import Document
+
+    doc = Document()
+    app.initialize_document(doc)
+    handler = app.handlers[0]
+    if handler.failed:
+        raise RuntimeError(f"Cyclops.py failed: {handler.error}\n{handler.error_detail}")
+    return doc.modules._modules[-1].__dict__
+
+
+def close_session(ns):
+    for callback in ns["doc"].session_destroyed_callbacks:
+        callback(None)
+
+
+def source_payload(source):
+    """Serialized size of ``source.data`` as Bokeh would send it, and how long that takes."""
+    from bokeh.core.json_encoder import serialize_json
+    from bokeh.core.serialization import Serializer
+
+    t0 = time.perf_counter()
+    rep = Serializer(deferred=True).serialize(dict(source.data))
+    content = serialize_json(rep)  # buffers become references, sent as separate binary frames
+    elapsed = time.perf_counter() - t0
+    buffers = sum(buf.data.nbytes for buf in rep.buffers)
+    return dict(rows=len(next(iter(source.data.values()), [])), json_bytes=len(content),
+                buffer_bytes=buffers, total_bytes=len(content) + buffers, serialize_ms=_ms(elapsed))
+
+
+def bench_fetch(app, stub, region, duration, tick):
+    """Call ``fetch_and_update`` every ``tick`` seconds on one session from a cold cache."""
+    from weather_cache import CACHE
+
+    ns = new_session(app)
+    if region != ns["active_region_key"]:
+        ns["region_callback"]("active", None, ns["region_keys"].index(region))
+    # The region's stations, not ``source``: that is empty while the region is drawn as clusters
+    ids = ns["catalog"].region_ids(region)
+    calls_before = dict(stub.RequestHandlerClass.state.calls)
+    version0, t_start = CACHE.version, time.perf_counter()
+    samples, all_fresh_s = [], None
+    while time.perf_counter() - t_start < duration:
+        t0 = time.perf_counter()
+        ns["fetch_and_update"]()
+        samples.append(time.perf_counter() - t0)
+        if all_fresh_s is None and len(CACHE.expired(ids, time.time())) == 0:
+            all_fresh_s = time.perf_counter() - t_start
+        time.sleep(tick)
+    elapsed = time.perf_counter() - t_start
+    observations = CACHE.version - version0
+    calls = {k: v - calls_before.get(k, 0) for k, v in stub.RequestHandlerClass.state.calls.items()}
+    close_session(ns)
+    return dict(
+        region=region, stations=len(ids), duration_s=round(elapsed, 3),
+        calls=len(samples), calls_per_s=round(len(samples) / elapsed, 2),
+        call_ms=_summary_ms(samples),
+        observations=observations, observations_per_s=round(observations / elapsed, 2),
+        all_fresh_s=None if all_fresh_s is None else round(all_fresh_s, 3),
+        stub_calls=calls,
+    )
+
+
+def bench_regions(app, rounds):
+    """``region_callback`` latency, bytes pushed and resulting ``source`` payload for every region."""
+    from metrics import WS_BYTES
+
+    ns = new_session(app)
+    keys = ns["region_keys"]
+    samples = {key: [] for key in keys}
+    payloads = {}
+    for _ in range(rounds):
+        for i, key in enumerate(keys):
+            old = keys.index(ns["active_region_key"])
+            sent0 = WS_BYTES.value()
+            t0 = time.perf_counter()
+            ns["region_callback"]("active", old, i)
+            samples[key].append(time.perf_counter() - t0)
+            if key not in payloads:
+                payloads[key] = dict(switch_bytes=WS_BYTES.value() - sent0,
+                                     source=source_payload(ns["source"]),
+                                     clusters=source_payload(ns["cluster_source"]))
+    close_session(ns)
+    return {
+        key: dict(first_ms=_ms(samples[key][0]), latency_ms=_summary_ms(samples[key]), **payloads[key])
+        for key in keys
+    }
+
+
+def bench_memory(app, sessions):
+    """Heap allocated per session and session build time, after one warm-up
+    session has paid for imports and caches (build times include tracemalloc overhead)."""
+    close_session(new_session(app))
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    kept, startup = [], []
+    for _ in range(sessions):
+        t0 = time.perf_counter()
+        kept.append(new_session(app))
+        startup.append(time.perf_counter() - t0)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for ns in kept:
+        close_session(ns)
+    return dict(
+        sessions=sessions,
+        per_session_bytes=int((current - base) / sessions),
+        peak_bytes=peak - base,
+        startup_ms=_summary_ms(startup),
+        process_max_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
+
+
+def _flatten(obj, prefix=""):
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            out.update(_flatten(v, f"{prefix}{k}."))
+        return out
+    if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        return {prefix[:-1]: obj}
+    return {}
+
+
+def compare(old, new, threshold=0.05):
+    """Print the numbers that moved by more than ``threshold`` between two result files."""
+    a, b = _flatten({k: old.get(k) for k in ("fetch", "regions", "memory")}), \
+        _flatten({k: new.get(k) for k in ("fetch", "regions", "memory")})
+    for key in sorted(set(a) & set(b)):
+        if a[key] == b[key] or key.endswith(".n"):
+            continue
+        change = (b[key] - a[key]) / abs(a[key]) if a[key] else float("inf")
+        if abs(change) >= threshold:
+            print(f"  {key:<50} {a[key]:>14,.3f} -> {b[key]:>14,.3f}  ({change:+.0%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Cyclops against a local OWM stand-in.")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random stub delay, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of stub calls failing with HTTP 500")
+    parser.add_argument("--rate-limit", type=int, default=0, help="stub calls per minute before HTTP 429 (0 = unlimited)")
+    parser.add_argument("--budget", type=float, default=600, help="CYCLOPS_REQUEST_BUDGET for the run")
+    parser.add_argument("--region", default="globe", help="region for the fetch benchmark")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of fetch_and_update calls")
+    parser.add_argument("--tick", type=float, default=0.1, help="seconds between fetch_and_update calls")
+    parser.add_argument("--rounds", type=int, default=3, help="passes over every region")
+    parser.add_argument("--sessions", type=int, default=10, help="sessions for the memory benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark-results.json")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    args = parser.parse_args(argv)
+
+    stub, base_url = owm_stub.start_in_thread(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_limit=args.rate_limit, seed=args.seed)
+    # Read by the shared modules at import time, so set before the app is built
+    os.environ["CYCLOPS_OWM_URL"] = base_url
+    os.environ["CYCLOPS_REQUEST_BUDGET"] = str(args.budget)
+    os.environ.pop("CYCLOPS_DB", None)
+
+    import bokeh
+    from bokeh.application import Application
+    from bokeh.application.handlers import ScriptHandler
+
+    app = Application(ScriptHandler(filename=APP_PATH))
+    results = dict(
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        commit=_git_commit(), python=platform.python_version(), bokeh=bokeh.__version__,
+        config={k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+    )
+    print("fetch_and_update throughput...", file=sys.stderr)
+    results["fetch"] = bench_fetch(app, stub, args.region, args.duration, args.tick)
+    print("region_callback latency...", file=sys.stderr)
+    results["regions"] = bench_regions(app, args.rounds)
+    print("per-session memory...", file=sys.stderr)
+    results["memory"] = bench_memory(app, args.sessions)
+    stub.shutdown()
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    fetch, memory = results["fetch"], results["memory"]
+    print(f"fetch: {fetch['observations_per_s']} obs/s, fetch_and_update median "
+          f"{fetch['call_ms'].get('median')} ms, all fresh after {fetch['all_fresh_s']} s")
+    for key, r in results["regions"].items():
+        print(f"region {key:<14} {r['latency_ms']['median']:>9.2f} ms  {r['switch_bytes']:>10,} bytes sent  "
+              f"{r['source']['rows']:>6} rows  {r['source']['total_bytes']:>10,} bytes")
+    print(f"memory: {memory['per_session_bytes']:,} bytes per session, "
+          f"built in {memory['startup_ms']['median']} ms (median)")
+    print(f"results written to {args.out}")
+    if args.compare:
+        with open(args.compare) as f:
+            print(f"changes vs {args.compare}:")
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
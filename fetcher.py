@@ -0,0 +1,302 @@
+"""Concurrent OpenWeatherMap fetch engine.
+
+Requests run on a bounded thread pool with a pooled keep-alive
+``requests.Session`` and per-request timeouts, so a refresh never blocks the
+Tornado IOLoop. Results land in the shared ``weather_cache.CACHE``, whose
+listeners hear about every write.
+
+Stations with a known OpenWeatherMap city ID are fetched up to
+``GROUP_SIZE`` at a time through ``/group``; the rest fall back to one
+``/weather?lat=..&lon=..`` call each. The city ID returned by a coordinate
+call is remembered, so from the next refresh on that station is batched too.
+Point ``CYCLOPS_OWM_URL`` at ``owm_stub.py`` to exercise this offline.
+
+Timeouts, connection errors and 5xx answers are retried a few times with
+jittered exponential backoff, HTTP 429 only when it comes with a
+``Retry-After``. A retry is a request like any other: the scheduler hands
+the engine its token bucket as ``budget``, and a call is given up on once
+that is spent. A circuit breaker counts failed
+attempts; after ``CYCLOPS_BREAKER_THRESHOLD`` in a row it stops
+calling the upstream for ``CYCLOPS_BREAKER_RESET`` seconds, then lets a
+single probe through. Meanwhile sessions keep showing the last known
+values from the cache, and refreshes return at once instead of waiting on
+calls that are bound to time out.
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import Gauge, OWM_ERRORS, OWM_REQUEST_SECONDS, OWM_RETRIES
+from weather_cache import CACHE
+
+# -- API KEY LOADING --
+# with open('ak.txt', 'r') as file:
+#     API_KEY0 = file.readline().strip()
+API_KEY = os.getenv("OPENWEATHERMAP_API_KEY", '6a449acfde38bcfa4a4465168a4b1a14')
+OWM_URL = os.getenv("CYCLOPS_OWM_URL", "https://api.openweathermap.org/data/2.5").rstrip("/")
+GROUP_SIZE = 20  # OWM limit for /group
+
+MAX_CONCURRENCY = int(os.getenv("CYCLOPS_MAX_CONCURRENCY", 8))
+REQUEST_TIMEOUT_S = float(os.getenv("CYCLOPS_HTTP_TIMEOUT", 5))
+HTTP_RETRIES = int(os.getenv("CYCLOPS_HTTP_RETRIES", 2))  # extra attempts per call
+BACKOFF_BASE_S = 0.5
+BACKOFF_CAP_S = 8.0
+BREAKER_THRESHOLD = int(os.getenv("CYCLOPS_BREAKER_THRESHOLD", 5))  # failed calls in a row
+BREAKER_RESET_S = float(os.getenv("CYCLOPS_BREAKER_RESET", 30))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit breaker is open."""
+
+
+def error_kind(exc):
+    """Short label for a failed request, used as the metrics ``kind``."""
+    if isinstance(exc, requests.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.ConnectionError):
+        return "connection"
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return f"http_{exc.response.status_code}"
+    if isinstance(exc, ValueError):
+        return "parse"
+    return "other"
+
+
+def upstream_failure(exc):
+    """Whether ``exc`` says the upstream is unhealthy (worth a retry), not that the request was bad."""
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+def retryable(exc):
+    """Whether a call that failed with ``exc`` is worth repeating.
+
+    A 429 without ``Retry-After`` is not: trying again soon only adds to the
+    rate limit it hit.
+    """
+    if not upstream_failure(exc):
+        return False
+    response = getattr(exc, "response", None)
+    if response is not None and response.status_code == 429:
+        return response.headers.get("Retry-After", "").isdigit()
+    return True
+
+
+def backoff_delay(attempt, exc=None, base=BACKOFF_BASE_S, cap=BACKOFF_CAP_S):
+    """Seconds to wait before retry ``attempt`` (0-based): full jitter, or the server's Retry-After."""
+    response = getattr(exc, "response", None)
+    if response is not None and response.headers.get("Retry-After", "").isdigit():
+        return min(cap, float(response.headers["Retry-After"]))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _number(value):
+    # JSON ints (humidity, pressure) and floats alike; NaN if absent or malformed
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def parse_observation(data):
+    """Pick the fields shown on the map out of an OWM current-weather payload.
+
+    Values are floats, so they pack straight into NumPy columns. Missing
+    fields are NaN (unknown), never 0, which would read as a real value.
+    ``dt`` is the observation time (epoch seconds) when the API reports one.
+    """
+    return dict(
+        dt=data.get("dt"),
+        cloud=_number(data.get("clouds", {}).get("all")),
+        temp=_number(data.get("main", {}).get("temp")),
+        humidity=_number(data.get("main", {}).get("humidity")),
+        pressure=_number(data.get("main", {}).get("pressure")),
+    )
+
+
+class CircuitBreaker:
+    """Closed -> open after ``threshold`` failures in a row -> half open after ``reset_after`` s.
+
+    Half open lets one probe call through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, reset_after=BREAKER_RESET_S):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or time.monotonic() - self._opened_at < self.reset_after:
+                return "open"
+            return "half_open"
+
+    def allow(self):
+        """May a call go out now? Claims the probe when half open."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_after:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class FetchEngine:
+    """Bounded-concurrency fetcher that de-duplicates in-flight stations."""
+
+    def __init__(self, max_workers=MAX_CONCURRENCY, timeout=REQUEST_TIMEOUT_S, cache=CACHE, base_url=OWM_URL,
+                 retries=HTTP_RETRIES, breaker=None, budget=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.budget = budget  # pays for retries with ``take()``, e.g. a scheduler's TokenBucket
+        self.breaker = CircuitBreaker() if breaker is None else breaker
+        self.cache = cache
+        self.base_url = base_url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="owm-fetch")
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> Future
+        self.owm_ids = {}  # key -> OWM city ID, learned from responses
+
+    def _get(self, endpoint, params):
+        params = dict(params, appid=API_KEY, units="metric")
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                OWM_ERRORS.inc(kind="circuit_open", endpoint=endpoint)
+                raise CircuitOpenError(f"not calling /{endpoint}: upstream circuit open")
+            try:
+                with OWM_REQUEST_SECONDS.time(endpoint=endpoint):
+                    resp = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=self.timeout)
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as exc:
+                OWM_ERRORS.inc(kind=error_kind(exc), endpoint=endpoint)
+                if not upstream_failure(exc):
+                    # The upstream answered; it is the request that was bad
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt == self.retries or not retryable(exc):
+                    raise
+                if self.budget is not None and not self.budget.take():
+                    raise  # no budget left for a retry: the scheduler tries again later
+                OWM_RETRIES.inc(endpoint=endpoint)
+                time.sleep(backoff_delay(attempt, exc))
+            else:
+                self.breaker.record_success()
+                return data
+
+    def fetch_city(self, city):
+        return self._get("weather", {"lat": city["lat"], "lon": city["lon"]})
+
+    def fetch_group(self, owm_ids):
+        """One ``/group`` call for up to ``GROUP_SIZE`` city IDs."""
+        data = self._get("group", {"id": ",".join(str(i) for i in owm_ids)})
+        return data.get("list", [])
+
+    def owm_id(self, key, city):
+        return city.get("owm_id") or self.owm_ids.get(key)
+
+    def _fetch_into_cache(self, key, city):
+        try:
+            data = self.fetch_city(city)
+        except Exception:
+            return None
+        if data.get("id"):
+            self.owm_ids[key] = data["id"]
+        obs = parse_observation(data)
+        self.cache.put(key, obs)
+        return obs
+
+    def _fetch_group_into_cache(self, batch):
+        keys_by_id = {}
+        for key, city in batch:
+            keys_by_id.setdefault(self.owm_id(key, city), []).append(key)
+        try:
+            items = self.fetch_group(list(keys_by_id))
+        except Exception:
+            return {}
+        results = {}
+        for data in items:
+            for key in keys_by_id.pop(data.get("id"), []):
+                results[key] = parse_observation(data)
+                self.cache.put(key, results[key])
+        # IDs the API did not answer for go back to coordinate lookups
+        for keys in keys_by_id.values():
+            for key in keys:
+                self.owm_ids.pop(key, None)
+        return results
+
+    def plan(self, stations):
+        """Split ``(key, city)`` pairs into request-sized batches.
+
+        Each batch costs exactly one HTTP request: up to ``GROUP_SIZE``
+        stations with an OWM city ID, or a single station without one.
+        Stations already in flight are left out.
+        """
+        grouped, single = [], []
+        with self._lock:
+            for key, city in stations:
+                if key in self._inflight:
+                    continue
+                (grouped if self.owm_id(key, city) else single).append((key, city))
+        return [grouped[i:i + GROUP_SIZE] for i in range(0, len(grouped), GROUP_SIZE)] + [[s] for s in single]
+
+    def submit_batch(self, batch):
+        """Start one request for a batch from ``plan()``; returns its Future."""
+        with self._lock:
+            batch = [(k, c) for k, c in batch if k not in self._inflight]
+            if not batch:
+                return None
+            if len(batch) == 1 and not self.owm_id(*batch[0]):
+                fut = self.executor.submit(self._fetch_into_cache, *batch[0])
+            else:
+                fut = self.executor.submit(self._fetch_group_into_cache, batch)
+            keys = [k for k, _ in batch]
+            for key in keys:
+                self._inflight[key] = fut
+        # Outside the lock: an already finished Future runs this inline
+        fut.add_done_callback(lambda f: self._forget(keys, f))
+        return fut
+
+    def _forget(self, keys, fut):
+        with self._lock:
+            for key in keys:
+                if self._inflight.get(key) is fut:
+                    del self._inflight[key]
+
+
+# One engine (thread pool + connection pool + circuit breaker) per server process
+ENGINE = FetchEngine()
+Gauge("cyclops_owm_circuit_open", "1 while the OpenWeatherMap circuit breaker blocks calls",
+      fn=lambda: float(ENGINE.breaker.state() != "closed"))
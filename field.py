@@ -0,0 +1,118 @@
+"""Interpolated temperature field rendered under the station markers.
+
+``IDWField`` computes an inverse-distance-weighted grid over a Mercator
+bounding box from station observations, in vectorized NumPy. It keeps the
+weighted sums (numerator and denominator) rather than just the image, so
+when only a few stations change their contributions are swapped out
+incrementally instead of recomputing the whole grid. Fields cover a whole
+region and are cached per (region, resolution), shared by all sessions;
+each session crops the cached image to its view, so panning and zooming
+never recompute anything.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+FIELD_RES = int(os.getenv("CYCLOPS_FIELD_RES", 160))  # grid columns
+IDW_POWER = 2.0
+# Rebuild from scratch when more than this fraction of stations changed
+INCREMENTAL_MAX = 0.1
+# Cap on stations feeding one grid; denser views are thinned evenly
+FIELD_MAX_STATIONS = 2000
+CHUNK = 32  # stations per weight block, bounds memory to CHUNK x grid
+CACHE_SIZE = 32
+
+
+class IDWField:
+    def __init__(self, x, y, bounds, width=FIELD_RES, power=IDW_POWER):
+        x0, x1, y0, y1 = bounds
+        height = max(1, int(round(width * (y1 - y0) / (x1 - x0))))
+        self.bounds = bounds
+        self.gx = x0 + (np.arange(width) + 0.5) * (x1 - x0) / width
+        self.gy = y0 + (np.arange(height) + 0.5) * (y1 - y0) / height
+        self.sx = np.asarray(x, dtype=np.float64)
+        self.sy = np.asarray(y, dtype=np.float64)
+        self.power = power
+        # Keeps a station sitting on a pixel centre finite
+        self.eps = (0.5 * (x1 - x0) / width) ** 2
+        self.values = np.full(len(self.sx), np.nan)
+        self.num = np.zeros((height, width))
+        self.den = np.zeros((height, width))
+        self.version = None
+        self.image = np.full((height, width), np.nan, dtype=np.float32)
+        self._lock = threading.Lock()
+
+    def _accumulate(self, idx, dv, dk):
+        # num += sum(w_i * dv_i), den += sum(w_i * dk_i) over stations idx
+        for i in range(0, len(idx), CHUNK):
+            j = idx[i:i + CHUNK]
+            dx = self.gx[None, None, :] - self.sx[j, None, None]
+            dy = self.gy[None, :, None] - self.sy[j, None, None]
+            w = (dx * dx + dy * dy + self.eps) ** (-self.power / 2)
+            self.num += np.tensordot(dv[i:i + CHUNK], w, axes=1)
+            self.den += np.tensordot(dk[i:i + CHUNK], w, axes=1)
+
+    def update(self, values, version=None):
+        """Image (float32, NaN where no data) for station ``values``.
+
+        Nothing is recomputed when ``version`` matches the previous call or
+        no value changed; a few changed stations are patched in.
+        """
+        with self._lock:
+            if version is not None and version == self.version:
+                return self.image
+            values = np.asarray(values, dtype=np.float64)
+            old = self.values
+            same = (values == old) | (np.isnan(values) & np.isnan(old))
+            changed = np.flatnonzero(~same)
+            self.version = version
+            if not len(changed):
+                return self.image
+            if len(changed) > INCREMENTAL_MAX * len(values):
+                self.num[:] = 0.0
+                self.den[:] = 0.0
+                changed = np.arange(len(values))
+                old = np.full(len(values), np.nan)
+            new_known, old_known = ~np.isnan(values[changed]), ~np.isnan(old[changed])
+            dv = np.where(new_known, values[changed], 0.0) - np.where(old_known, old[changed], 0.0)
+            dk = new_known.astype(np.float64) - old_known
+            self._accumulate(changed, dv, dk)
+            self.values = values.copy()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                image = self.num / self.den
+            image[self.den <= 0] = np.nan
+            self.image = image.astype(np.float32)
+            return self.image
+
+    def crop(self, image, bounds):
+        """The part of ``image`` (from ``update()``) covering ``bounds``, and its ``(x0, x1, y0, y1)``.
+
+        The crop is widened to whole pixels and clipped to the field.
+        """
+        x0, x1, y0, y1 = self.bounds
+        height, width = image.shape
+        px, py = (x1 - x0) / width, (y1 - y0) / height
+        c0 = int(np.clip(np.floor((bounds[0] - x0) / px), 0, width))
+        c1 = int(np.clip(np.ceil((bounds[1] - x0) / px), c0, width))
+        r0 = int(np.clip(np.floor((bounds[2] - y0) / py), 0, height))
+        r1 = int(np.clip(np.ceil((bounds[3] - y0) / py), r0, height))
+        return image[r0:r1, c0:c1], (x0 + c0 * px, x0 + c1 * px, y0 + r0 * py, y0 + r1 * py)
+
+
+_fields = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_field(key, x, y, bounds, width=FIELD_RES):
+    """Cached ``IDWField`` for ``key`` (e.g. region, resolution), LRU-evicted."""
+    with _lock:
+        field = _fields.get(key)
+        if field is None:
+            field = _fields[key] = IDWField(x, y, bounds, width)
+            while len(_fields) > CACHE_SIZE:
+                _fields.popitem(last=False)
+        else:
+            _fields.move_to_end(key)
+        return field
@@ -0,0 +1,72 @@
+"""Vectorized Web Mercator helpers."""
+import numpy as np
+
+EARTH_RADIUS_M = 6378137.0
+# Web Mercator is cut off at the latitude where the map becomes square
+MAX_LAT = 85.0511287798
+# Half the width of the Web Mercator square, in metres
+MERC_MAX = EARTH_RADIUS_M * np.pi
+
+
+def latlon_to_mercator(lat, lon):
+    """Project whole lat/lon arrays to Web Mercator metres in one pass.
+
+    Latitudes are clamped to +-``MAX_LAT`` so the poles map to the edge of
+    the map instead of +-inf. Returns float64 arrays.
+    """
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -MAX_LAT, MAX_LAT)
+    lon = np.asarray(lon, dtype=np.float64)
+    x = lon * (EARTH_RADIUS_M * np.pi / 180.0)
+    y = np.log(np.tan((90.0 + lat) * np.pi / 360.0)) * EARTH_RADIUS_M
+    return x, y
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance in km; works on scalars or arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M / 1000.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class GridIndex:
+    """Uniform-grid spatial index over projected points.
+
+    Points are bucketed into square cells and stored sorted by cell key, so a
+    bounding-box query costs one ``searchsorted`` per grid column it spans
+    plus the points it returns, not a scan of every point.
+    """
+
+    def __init__(self, x, y, cell_size=250_000.0):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.cell = float(cell_size)
+        self.n_cells = int(np.ceil(2 * MERC_MAX / self.cell)) + 1
+        keys = self._cx(self.x) * self.n_cells + self._cx(self.y)
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def _cx(self, v):
+        c = np.floor((np.clip(v, -MERC_MAX, MERC_MAX) + MERC_MAX) / self.cell)
+        return np.asarray(c, dtype=np.int64)
+
+    def cells(self, x0, x1, y0, y1):
+        """``(cx0, cx1, cy0, cy1)``: the range of grid cells covering ``[x0, x1] x [y0, y1]``."""
+        return int(self._cx(x0)), int(self._cx(x1)), int(self._cx(y0)), int(self._cx(y1))
+
+    def _candidates(self, cx0, cx1, cy0, cy1):
+        cols = np.arange(cx0, cx1 + 1, dtype=np.int64) * self.n_cells
+        lo = np.searchsorted(self.keys, cols + cy0, side="left")
+        hi = np.searchsorted(self.keys, cols + cy1, side="right")
+        if not len(cols) or not (hi > lo).any():
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([self.order[a:b] for a, b in zip(lo, hi) if b > a])
+
+    def query_cells(self, cx0, cx1, cy0, cy1):
+        """Sorted indices of the points in a range of cells from ``cells()``."""
+        return np.sort(self._candidates(cx0, cx1, cy0, cy1))
+
+    def query(self, x0, x1, y0, y1):
+        """Sorted indices of the points inside ``[x0, x1] x [y0, y1]``."""
+        cand = self._candidates(*self.cells(x0, x1, y0, y1))
+        inside = (self.x[cand] >= x0) & (self.x[cand] <= x1) & (self.y[cand] >= y0) & (self.y[cand] <= y1)
+        return np.sort(cand[inside])
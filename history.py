@@ -0,0 +1,86 @@
+"""Fixed-memory observation history for time-slider playback.
+
+Every observation written to the shared cache is also recorded into a
+preallocated NumPy ring buffer of shape ``(station, time slot, field)``.
+Slots are ``CYCLOPS_HISTORY_STEP`` seconds wide and the ring holds
+``CYCLOPS_HISTORY_HOURS`` of them, so memory stays fixed however long the
+server runs. Replaying a past moment is a fancy-indexing read, with no API
+calls.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+from weather_cache import CACHE, MAX_REFRESH_S
+
+HISTORY_HOURS = float(os.getenv("CYCLOPS_HISTORY_HOURS", 24))
+HISTORY_STEP_S = float(os.getenv("CYCLOPS_HISTORY_STEP", 600))
+FIELDS = ("cloud", "temp", "humidity", "pressure")
+# A station missing from a slot falls back to its value this many slots earlier,
+# enough to bridge the longest gap between two fetches plus one slot of slack
+FILL_SLOTS = int(np.ceil(MAX_REFRESH_S / HISTORY_STEP_S)) + 1
+
+
+class ObservationHistory:
+    def __init__(self, retention_s=HISTORY_HOURS * 3600, step_s=HISTORY_STEP_S, capacity=1024):
+        self.step = float(step_s)
+        self.n_slots = max(1, int(round(retention_s / self.step)))
+        self._lock = threading.Lock()
+        self._row = {}  # station key -> row
+        self.values = np.full((capacity, self.n_slots, len(FIELDS)), np.nan, dtype=np.float32)
+        self.slot_start = np.full(self.n_slots, np.nan)  # epoch start of the period each slot holds
+
+    def _row_for(self, key):
+        row = self._row.get(key)
+        if row is None:
+            row = self._row[key] = len(self._row)
+            if row >= len(self.values):  # grow by doubling; rare after the first refresh
+                grown = np.full((2 * len(self.values),) + self.values.shape[1:], np.nan, dtype=np.float32)
+                grown[:len(self.values)] = self.values
+                self.values = grown
+        return row
+
+    def _slot(self, t):
+        period = np.floor(t / self.step)
+        return int(period % self.n_slots), period * self.step
+
+    def record(self, key, obs, t=None):
+        """Store ``obs`` in the slot covering time ``t``; cache listener."""
+        t = time.time() if t is None else t
+        slot, start = self._slot(t)
+        with self._lock:
+            if self.slot_start[slot] != start:  # the ring wrapped: drop the old period
+                self.values[:, slot] = np.nan
+                self.slot_start[slot] = start
+            # _row_for may grow (replace) self.values, so index only after it
+            row = self._row_for(key)
+            self.values[row, slot] = [obs.get(f, np.nan) for f in FIELDS]
+
+    def rows(self, keys):
+        """Row of each key, -1 for stations never recorded."""
+        with self._lock:
+            return np.fromiter((self._row.get(k, -1) for k in keys), dtype=np.intp, count=len(keys))
+
+    def snapshot(self, keys, t):
+        """``{field: float array}`` for ``keys`` as they were at time ``t``."""
+        rows = self.rows(keys)
+        known = rows >= 0
+        out = np.full((len(keys), len(FIELDS)), np.nan, dtype=np.float32)
+        slot, start = self._slot(t)
+        with self._lock:
+            for back in range(FILL_SLOTS + 1):
+                s = (slot - back) % self.n_slots
+                if self.slot_start[s] != start - back * self.step:
+                    continue
+                missing = known & np.isnan(out[:, 0])
+                out[missing] = self.values[rows[missing], s]
+        # One contiguous float32 array per field, ready for Bokeh's binary encoding
+        return dict(zip(FIELDS, np.ascontiguousarray(out.T)))
+
+
+# One history per server process, fed by every fetch. Unchanged observations
+# count too, or slots between two new ones would stay empty.
+HISTORY = ObservationHistory()
+CACHE.add_listener(HISTORY.record, renewals=True)
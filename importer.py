@@ -0,0 +1,277 @@
+"""Bulk station import from GeoNames dumps or plain CSV files.
+
+Loads a large table into a ``StationCatalog`` and assigns stations to the
+map's regions with vectorized point-in-polygon tests (country regions go by
+country code), so catalogs of 100k+ places load in seconds instead of being
+written out as dict literals.
+
+Supported inputs (optionally ``.zip``/``.gz`` compressed):
+
+* GeoNames ``cities*.txt`` / ``allCountries.txt`` dumps (tab separated,
+  no header), see https://download.geonames.org/export/dump/
+* CSV with a header containing ``name``, ``lat``/``latitude`` and
+  ``lon``/``lng``/``longitude``; ``country``, ``population``, ``id`` and
+  ``owm_id`` columns are used when present.
+
+Every imported station is also added to ``globe``. Set
+``CYCLOPS_STATIONS_FILE`` to load a file into the app on startup, or run
+``python importer.py FILE`` to check what an import would produce.
+"""
+import argparse
+import csv
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from stations import StationCatalog
+
+STATIONS_FILE = os.getenv("CYCLOPS_STATIONS_FILE")
+STATIONS_MIN_POP = int(os.getenv("CYCLOPS_STATIONS_MIN_POP", 0))
+STATIONS_COUNTRIES = os.getenv("CYCLOPS_STATIONS_COUNTRIES")  # e.g. "GR,CY"
+
+# Border segments shared by two regions, so neighbours meet without overlapping
+_MEDITERRANEAN = [  # africa / europe, west to east
+    (31.0, -11.0), (35.95, -6.3), (35.95, -5.2), (36.0, -1.0), (37.4, 3.0), (37.6, 8.0),
+    (37.6, 11.3), (35.8, 11.6), (34.5, 12.2), (34.5, 24.0), (34.0, 28.5),
+]
+_SUEZ_RED_SEA = [  # africa / west_asia, north to south
+    (34.0, 28.5), (32.5, 32.0), (31.3, 34.22), (29.5, 34.9), (28.0, 34.45), (27.6, 34.8),
+    (24.0, 36.7), (21.0, 38.4), (17.5, 39.8), (15.5, 41.0), (13.5, 42.5), (12.55, 43.35),
+    (12.2, 45.0), (12.0, 51.6), (12.0, 64.0),
+]
+_AEGEAN_CAUCASUS = [  # europe / west_asia, Crete to the Caspian
+    (34.0, 28.5), (36.6, 28.5), (36.6, 27.3), (37.0, 27.3), (37.9, 27.15), (38.3, 26.22),
+    (39.0, 26.62), (39.5, 26.45), (39.75, 25.9), (40.1, 25.6), (40.73, 26.04), (41.0, 26.36),
+    (41.35, 26.64), (41.6, 26.62), (41.72, 26.36), (41.98, 28.03), (42.2, 29.0), (42.5, 35.0),
+    (43.4, 40.0), (43.0, 42.0), (42.6, 44.6), (41.85, 48.6),
+]
+_IRAN_EAST = [  # west_asia / south_asia, north to south
+    (35.6, 61.27), (34.5, 60.95), (30.9, 61.7), (29.8, 60.9), (27.2, 63.3), (25.1, 61.6), (12.0, 64.0),
+]
+_HIMALAYA = [  # south_asia / east_asia, west to east
+    (37.05, 74.9), (36.85, 75.45), (35.5, 77.8), (34.0, 79.2), (32.6, 79.5), (31.0, 79.1),
+    (30.2, 81.0), (30.45, 81.5), (29.3, 83.9), (28.3, 85.5), (27.95, 86.9), (27.85, 88.1),
+    (27.3, 88.85), (27.9, 89.2), (28.3, 90.0), (27.8, 91.6), (28.2, 93.0), (29.3, 95.0),
+    (29.2, 96.0), (28.2, 97.3),
+]
+_CARIBBEAN = [  # north_america / south_america, Pacific to Atlantic
+    (5.0, -82.0), (7.3, -77.9), (8.7, -77.35), (13.0, -72.0), (12.8, -68.0), (11.8, -61.5), (11.8, -40.0),
+]
+_NORTH_ATLANTIC = [  # north_america / europe, south to north
+    (50.0, -40.0), (50.0, -30.0), (67.0, -30.0), (72.0, -15.0), (85.0, -10.0),
+]
+
+
+def _box(lat0, lat1, lon0, lon1):
+    return [(lat0, lon0), (lat1, lon0), (lat1, lon1), (lat0, lon1)]
+
+
+# Polygons of (lat, lon) vertices per region, drawn along coasts and borders.
+# Deliberate overlaps and gaps:
+# * poles overlaps the Arctic and Antarctic parts of the continents;
+# * Turkey (Istanbul included) and Cyprus are west_asia, Egypt (Sinai
+#   included) is africa, Russia west of the Urals is europe;
+# * Siberia, Central Asia and South-East Asia belong to no region but globe;
+#   Hawaii and the Pacific islands are australia (Oceania);
+# * a town within ~20 km of a border may land on the other side of it
+#   (e.g. Kastellorizo, Heihe).
+REGION_SHAPES = {
+    "north_america": [
+        [(85.0, -169.0), (65.5, -169.0), (64.0, -175.0), (60.0, -180.0), (50.0, -180.0),
+         (48.0, -130.0), (20.0, -118.0), (5.0, -90.0)] + _CARIBBEAN + _NORTH_ATLANTIC,
+        _box(50.0, 56.0, 172.0, 180.0),  # western Aleutians
+    ],
+    "south_america": [
+        _CARIBBEAN + [(5.0, -28.0), (-60.0, -28.0), (-60.0, -93.0), (5.0, -93.0)],
+    ],
+    "europe": [
+        [(31.0, -40.0)] + _NORTH_ATLANTIC + [
+            (85.0, 70.0), (77.0, 70.0), (68.0, 66.0), (60.0, 59.5), (52.0, 59.0), (51.8, 56.0),
+            (51.3, 51.5), (47.0, 51.9),
+        ] + _AEGEAN_CAUCASUS[::-1] + _MEDITERRANEAN[-2::-1],
+    ],
+    "africa": [
+        [(31.0, -40.0)] + _MEDITERRANEAN + _SUEZ_RED_SEA[1:] + [
+            (-50.0, 64.0), (-50.0, -28.0), (5.0, -28.0), (11.8, -40.0),
+        ],
+    ],
+    "west_asia": [
+        _AEGEAN_CAUCASUS + [
+            (39.0, 52.5), (37.3, 53.9), (38.1, 57.0), (37.4, 59.3), (36.6, 61.2),
+        ] + _IRAN_EAST + _SUEZ_RED_SEA[-2:0:-1],
+    ],
+    "south_asia": [
+        _IRAN_EAST[:1] + [
+            (35.25, 62.3), (35.95, 63.9), (36.9, 65.2), (37.4, 66.5), (37.05, 67.8), (37.25, 69.3),
+            (38.3, 70.6), (37.0, 71.55), (37.4, 73.9),
+        ] + _HIMALAYA + [
+            (27.3, 97.0), (26.0, 95.15), (24.5, 94.6), (23.8, 93.4), (22.0, 93.2), (21.15, 92.6),
+            (20.6, 92.3), (14.0, 92.2), (13.8, 94.5), (-8.0, 94.5), (-8.0, 64.0),
+        ] + _IRAN_EAST[:0:-1],
+    ],
+    "east_asia": [
+        [
+            (49.2, 87.3), (48.5, 86.7), (47.3, 85.6), (47.0, 83.0), (45.3, 82.4), (44.2, 80.3),
+            (42.9, 80.2), (42.0, 77.5), (40.5, 75.0), (39.7, 73.6), (38.4, 74.9),
+        ] + _HIMALAYA + [
+            (27.8, 98.7), (25.9, 98.7), (24.1, 97.6), (23.6, 98.9), (22.0, 99.4), (21.15, 101.15),
+            (22.4, 102.2), (22.5, 104.0), (23.0, 105.5), (22.9, 106.5), (22.1, 106.6), (21.55, 108.0),
+            (18.0, 108.3), (17.5, 110.0), (20.0, 117.0), (21.3, 120.3), (21.3, 123.0), (22.0, 135.0),
+            (22.0, 155.0), (43.0, 155.0), (43.2, 146.2), (43.6, 145.55), (44.4, 145.45), (45.6, 142.5),
+            (45.6, 141.0), (42.2, 133.0), (42.3, 130.7), (42.9, 130.6), (44.4, 131.25), (45.3, 133.1),
+            (46.8, 134.15), (48.3, 134.7), (47.85, 132.6), (49.3, 129.6), (50.2, 127.5), (53.35, 123.5),
+            (53.35, 121.2), (49.85, 116.7), (50.3, 114.3), (49.5, 110.0), (50.3, 106.5), (50.3, 104.5),
+            (51.5, 102.0), (51.5, 100.5), (52.1, 98.9), (50.6, 97.3), (50.0, 94.0), (50.2, 90.0),
+        ],
+    ],
+    "australia": [
+        [(-10.0, 95.0), (-10.0, 110.0), (-11.6, 122.0), (-11.0, 128.0), (-9.13, 141.0), (-2.6, 141.0),
+         (0.5, 135.0), (2.5, 130.9), (9.0, 132.0), (22.0, 135.0), (22.0, 180.0), (-60.0, 180.0),
+         (-60.0, 95.0)],
+        [(30.0, -180.0), (30.0, -150.0), (0.0, -120.0), (-20.0, -105.0), (-30.0, -100.0),
+         (-60.0, -100.0), (-60.0, -180.0)],
+    ],
+    "poles": [_box(66.5, 91.0, -181.0, 181.0), _box(-91.0, -60.0, -181.0, 181.0)],
+}
+# Regions that are whole countries go by the ``country`` column (ISO codes);
+# greece is a subset of europe
+REGION_COUNTRIES = {
+    "greece": ("GR",),
+}
+
+GEONAMES_COLUMNS = [
+    "geonameid", "name", "asciiname", "alternatenames", "latitude", "longitude",
+    "feature_class", "feature_code", "country_code", "cc2", "admin1_code",
+    "admin2_code", "admin3_code", "admin4_code", "population", "elevation",
+    "dem", "timezone", "modification_date",
+]
+CSV_ALIASES = {
+    "latitude": "lat", "longitude": "lon", "lng": "lon",
+    "country_code": "country", "cc": "country",
+}
+
+
+def _is_geonames(path):
+    base = path.lower()
+    for ext in (".zip", ".gz"):
+        if base.endswith(ext):
+            base = base[:-len(ext)]
+    return base.endswith(".txt")
+
+
+def read_table(path):
+    """Read ``path`` into a DataFrame with ``id, name, lat, lon, country, population, owm_id``."""
+    if _is_geonames(path):
+        df = pd.read_csv(
+            path, sep="\t", header=None, names=GEONAMES_COLUMNS,
+            usecols=["geonameid", "name", "latitude", "longitude", "country_code", "population"],
+            dtype={"geonameid": str, "name": str, "country_code": str},
+            quoting=csv.QUOTE_NONE, keep_default_na=False, na_values={"population": [""]},
+        )
+        df = df.rename(columns={"geonameid": "id", "latitude": "lat", "longitude": "lon", "country_code": "country"})
+        df["id"] = "gn" + df["id"]
+        df["name"] = df["name"] + ", " + df["country"]
+        df["owm_id"] = 0
+    else:
+        df = pd.read_csv(path, keep_default_na=False, na_values={"population": [""], "owm_id": [""]})
+        df.columns = [c.strip().lower() for c in df.columns]
+        df = df.rename(columns={k: v for k, v in CSV_ALIASES.items() if k in df.columns})
+        missing = {"name", "lat", "lon"} - set(df.columns)
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        if "id" not in df.columns:
+            df["id"] = df["name"].astype(str) + "@" + df["lat"].map("{:.4f}".format) + "," + df["lon"].map("{:.4f}".format)
+        for col, default in (("country", ""), ("population", 0), ("owm_id", 0)):
+            if col not in df.columns:
+                df[col] = default
+    df["population"] = pd.to_numeric(df["population"], errors="coerce").fillna(0).astype(np.int64)
+    df["owm_id"] = pd.to_numeric(df["owm_id"], errors="coerce").fillna(0).astype(np.int64)
+    df["country"] = df["country"].astype(str).str.upper()
+    return df[["id", "name", "lat", "lon", "country", "population", "owm_id"]]
+
+
+def _in_polygon(lat, lon, polygon):
+    """Even-odd ray casting of points against one ``[(lat, lon), ...]`` ring."""
+    ring = np.asarray(polygon, dtype=np.float64)
+    inside = np.zeros(len(lat), dtype=bool)
+    near = ((lat >= ring[:, 0].min()) & (lat <= ring[:, 0].max())
+            & (lon >= ring[:, 1].min()) & (lon <= ring[:, 1].max()))
+    y, x = lat[near], lon[near]
+    hit = np.zeros(len(y), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for (y0, x0), (y1, x1) in zip(ring, np.roll(ring, -1, axis=0)):
+            crosses = (y0 > y) != (y1 > y)
+            hit ^= crosses & (x < x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+    inside[near] = hit
+    return inside
+
+
+def region_masks(lat, lon, country=None, shapes=REGION_SHAPES, countries=REGION_COUNTRIES):
+    """``{region: bool array}`` of which stations fall inside each region.
+
+    Continents are tested against their polygons, country regions against the
+    ``country`` codes; without codes no station joins a country region.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    masks = {}
+    for region, polygons in shapes.items():
+        mask = np.zeros(len(lat), dtype=bool)
+        for polygon in polygons:
+            mask |= _in_polygon(lat, lon, polygon)
+        masks[region] = mask
+    codes = np.asarray(country if country is not None else [""] * len(lat), dtype=str)
+    for region, members in countries.items():
+        masks[region] = np.isin(codes, members)
+    return masks
+
+
+def import_stations(path, min_population=0, countries=None, shapes=REGION_SHAPES,
+                    region_countries=REGION_COUNTRIES, globe=True):
+    """Load ``path`` into a ``StationCatalog`` with one row per station.
+
+    Stations outside every region (only possible with ``globe=False``) are dropped.
+    """
+    df = read_table(path)
+    keep = df["population"].to_numpy() >= min_population
+    if countries:
+        keep &= df["country"].isin([c.strip().upper() for c in countries]).to_numpy()
+    df = df[keep]
+    lat, lon = df["lat"].to_numpy(np.float64), df["lon"].to_numpy(np.float64)
+    masks = region_masks(lat, lon, df["country"].to_numpy(), shapes, region_countries)
+    if globe:
+        masks["globe"] = np.ones(len(df), dtype=bool)
+
+    region_mask = np.zeros(len(df), dtype=np.uint64)
+    for bit, mask in enumerate(masks.values()):
+        region_mask[mask] |= np.uint64(1 << bit)
+    keep = region_mask != 0
+    return StationCatalog(
+        df["id"].astype(str).to_numpy()[keep].tolist(), df["name"].to_numpy()[keep].tolist(),
+        lat[keep], lon[keep], region_mask[keep], list(masks), df["owm_id"].to_numpy()[keep],
+    )
+
+
+@lru_cache(maxsize=None)
+def configured_stations():
+    """Catalog from ``CYCLOPS_STATIONS_FILE``, imported once per process; ``None`` if unset."""
+    if not STATIONS_FILE:
+        return None
+    countries = STATIONS_COUNTRIES.split(",") if STATIONS_COUNTRIES else None
+    return import_stations(STATIONS_FILE, STATIONS_MIN_POP, countries)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import stations from a GeoNames dump or CSV file.")
+    parser.add_argument("path")
+    parser.add_argument("--min-population", type=int, default=0)
+    parser.add_argument("--countries", help="comma separated ISO country codes, e.g. GR,CY")
+    args = parser.parse_args()
+    t0 = time.perf_counter()
+    catalog = import_stations(args.path, args.min_population, args.countries.split(",") if args.countries else None)
+    print(f"{len(catalog)} stations in {time.perf_counter() - t0:.2f}s")
+    for region in list(REGION_SHAPES) + list(REGION_COUNTRIES) + ["globe"]:
+        print(f"  {region:<14} {len(catalog.region_rows(region))}")
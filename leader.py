@@ -0,0 +1,111 @@
+"""Several server processes, one of them polling OpenWeatherMap.
+
+``serve.py --num-procs N`` (or ``bokeh serve --num-procs N``) forks N
+worker processes, each with its own cache, scheduler and poller. With
+``CYCLOPS_DB`` set they coordinate through that SQLite file (WAL mode):
+
+* the process holding the ``poller`` lease does all the fetching and writes
+  observations through to the store as usual. It renews the lease on every
+  poller tick; if it dies, another process takes over once the lease has run
+  out (``CYCLOPS_LEASE_TTL`` seconds);
+* every other process skips its scheduler and reads the rows written since
+  its last look into its own cache, which pushes them to its sessions like
+  any other cache write;
+* those followers also publish which stations their sessions display, so
+  the leader refreshes them first.
+
+Upstream traffic is that of one process however many serve browsers. A
+single process with ``CYCLOPS_DB`` simply always holds the lease.
+"""
+import hashlib
+import logging
+import os
+import socket
+import time
+
+from metrics import Counter, Gauge
+from scheduler import SCHEDULER, RemoteWatcher
+from weather_cache import CACHE
+
+log = logging.getLogger(__name__)
+
+LEASE_TTL_S = float(os.getenv("CYCLOPS_LEASE_TTL", 15))
+LEASE_NAME = "poller"
+# Rows are read again this far back, in case a fetch thread saved one late
+READ_OVERLAP_S = 5.0
+
+STORE_READS = Counter("cyclops_store_observations_total", "New observations read from the shared store (followers only)")
+
+
+class Coordinator:
+    def __init__(self, store, scheduler=SCHEDULER, cache=CACHE, ttl=LEASE_TTL_S):
+        self.store = store
+        self.scheduler = scheduler
+        self.cache = cache
+        self.ttl = ttl
+        self.leader = False
+        self._cursor = time.time()  # newest fetch time read from the store
+        self._remote = {}  # holder -> digest of its watch list, adopted into the scheduler
+
+    @property
+    def holder(self):
+        # Not fixed at import: worker processes are forked after that
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def lead(self):
+        """Take or renew the lease and sync with the store; ``True`` if this process should fetch."""
+        now = time.time()
+        leader = self.store.acquire_lease(LEASE_NAME, self.holder, self.ttl, now)
+        if leader != self.leader:
+            log.info("leader: %s the poller lease (%s)", "took" if leader else "lost", self.holder)
+            self.leader = leader
+            if leader:  # others have been fetching into our cache meanwhile
+                self.scheduler.resync()
+        if leader:
+            self._adopt_watchers(now)
+            self._cursor = now  # our own writes are in the cache already
+        else:
+            self._drop_watchers()
+            self._publish_watchers(now)
+            self._follow()
+        return leader
+
+    def release(self):
+        """Give the lease up, e.g. on shutdown, so another process takes over at once."""
+        if self.leader:
+            self.store.release_lease(LEASE_NAME, self.holder)
+            self.leader = False
+        self._drop_watchers()
+
+    def _follow(self):
+        rows = list(self.store.load_since(self._cursor - READ_OVERLAP_S))
+        if rows:
+            self._cursor = max(self._cursor, rows[-1][1])
+            STORE_READS.inc(self.cache.ingest(rows))
+
+    def _publish_watchers(self, now):
+        keys = self.scheduler.watched(local_only=True)
+        digest = hashlib.sha1("\n".join(sorted(keys)).encode()).hexdigest()
+        self.store.save_watched(self.holder, digest, keys, now)
+
+    def _adopt_watchers(self, now):
+        digests = self.store.watched_digests(now - self.ttl)  # processes still alive
+        digests.pop(self.holder, None)
+        for holder in set(self._remote) - set(digests):
+            self.scheduler.unwatch(RemoteWatcher(holder))
+            del self._remote[holder]
+        for holder, digest in digests.items():
+            if self._remote.get(holder) != digest:
+                self.scheduler.watch(RemoteWatcher(holder), self.store.load_watched(holder))
+                self._remote[holder] = digest
+
+    def _drop_watchers(self):
+        for holder in self._remote:
+            self.scheduler.unwatch(RemoteWatcher(holder))
+        self._remote.clear()
+
+
+# Processes sharing a store elect one poller; without a store each process fetches for itself
+COORDINATOR = Coordinator(CACHE.store) if CACHE.store is not None else None
+Gauge("cyclops_poller_leader", "1 if this process fetches from OpenWeatherMap, 0 if it reads the shared store",
+      fn=lambda: 1 if COORDINATOR is None or COORDINATOR.leader else 0)
@@ -0,0 +1,78 @@
+"""Level-of-detail clustering for large station catalogs.
+
+At world zoom one glyph per station is unreadable and slow once a region
+holds thousands of stations. ``LODPyramid`` bins a region's Mercator
+coordinates into square grid cells at several sizes once, up front; per
+refresh it only aggregates the current temperatures into the cells of one
+level (mean, min and max) with ``np.bincount``.
+"""
+import os
+
+import numpy as np
+
+# Cell edge lengths in metres, coarsest first
+LEVEL_CELLS_M = (2_000_000.0, 1_000_000.0, 500_000.0, 250_000.0, 125_000.0, 62_500.0)
+# Roughly how many clusters across the visible width
+LOD_COLUMNS = 40
+# Draw individual stations while at most this many are in view
+LOD_MAX_POINTS = int(os.getenv("CYCLOPS_LOD_MAX_POINTS", 1500))
+
+
+class LODPyramid:
+    def __init__(self, x, y, cell_sizes=LEVEL_CELLS_M):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self.cell_sizes = tuple(cell_sizes)
+        self.levels = []
+        for size in self.cell_sizes:
+            kx = np.floor(x / size).astype(np.int64)
+            ky = np.floor(y / size).astype(np.int64)
+            cells, inverse = np.unique((kx << 32) + ky, return_inverse=True)
+            count = np.bincount(inverse, minlength=len(cells))
+            self.levels.append(dict(
+                inverse=inverse,
+                count=count,
+                # Clusters sit at the centroid of their stations, not the cell centre
+                x=np.bincount(inverse, x, len(cells)) / count,
+                y=np.bincount(inverse, y, len(cells)) / count,
+            ))
+
+    def level_for(self, span):
+        """Level whose cells give about ``LOD_COLUMNS`` clusters across ``span`` metres."""
+        target = span / LOD_COLUMNS
+        for level in range(len(self.cell_sizes) - 1, -1, -1):
+            if self.cell_sizes[level] >= target:
+                return level
+        return 0
+
+    def columns(self, level, values, bounds=None):
+        """Cluster columns for ``values`` (one per station, NaN = unknown).
+
+        Returns ``x``, ``y``, ``count``, ``temp`` (mean), ``tmin``, ``tmax``
+        and ``size`` arrays, limited to clusters inside ``bounds``
+        (``x0, x1, y0, y1``) when given.
+        """
+        lv = self.levels[level]
+        n = len(lv["count"])
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        inv, vals = lv["inverse"][valid], values[valid]
+        known = np.bincount(inv, minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.bincount(inv, vals, n) / known
+        tmin = np.full(n, np.inf)
+        tmax = np.full(n, -np.inf)
+        np.minimum.at(tmin, inv, vals)
+        np.maximum.at(tmax, inv, vals)
+        tmin[known == 0] = tmax[known == 0] = np.nan
+
+        sel = slice(None)
+        if bounds is not None:
+            x0, x1, y0, y1 = bounds
+            sel = (lv["x"] >= x0) & (lv["x"] <= x1) & (lv["y"] >= y0) & (lv["y"] <= y1)
+        count = lv["count"][sel]
+        return dict(
+            x=lv["x"][sel], y=lv["y"][sel], count=count,
+            temp=mean[sel], tmin=tmin[sel], tmax=tmax[sel],
+            size=np.clip(10 + 4 * np.log2(count), 10, 44),
+        )
@@ -0,0 +1,152 @@
+"""Minimal in-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms register themselves in ``REGISTRY`` when
+created; ``render()`` returns the whole registry in the Prometheus text
+format (served at ``/metrics`` by ``serve.py``). Create instruments in
+modules that are imported once per process, not in ``Cyclops.py``, which
+runs again for every session.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+REGISTRY = []
+
+# Seconds; suits both single OWM calls and whole refreshes
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _fmt_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+def _fmt_value(v):
+    return repr(float(v)) if v != float("inf") else "+Inf"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        super().__init__(name, help_text)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def lines(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_fmt_labels(k)} {_fmt_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Set directly, or computed on every scrape when ``fn`` is given."""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, fn=None):
+        super().__init__(name, help_text)
+        self.fn = fn
+        self._value = 0.0
+
+    def set(self, value):
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def lines(self):
+        value = self.fn() if self.fn is not None else self._value
+        return [f"{self.name} {_fmt_value(value)}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._series = {}  # labels -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - t0, **labels)
+
+    def lines(self):
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        out = []
+        for key, series in items:
+            for bound, n in zip(self.buckets, series):
+                out.append(f"{self.name}_bucket{_fmt_labels(key + (('le', _fmt_value(bound)),))} {n}")
+            out.append(f"{self.name}_sum{_fmt_labels(key)} {_fmt_value(series[-2])}")
+            out.append(f"{self.name}_count{_fmt_labels(key)} {series[-1]}")
+        return out
+
+
+def render():
+    """Every registered metric in Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY:
+        lines += metric.header() + metric.lines()
+    return "\n".join(lines) + "\n"
+
+
+# -- Instruments shared across modules --
+SESSIONS = Gauge("cyclops_active_sessions", "Bokeh sessions currently open")
+REFRESH_SECONDS = Histogram("cyclops_refresh_seconds", "Time one session refresh spends on the server IOLoop")
+OWM_REQUEST_SECONDS = Histogram("cyclops_owm_request_seconds", "OpenWeatherMap request latency")
+OWM_ERRORS = Counter("cyclops_owm_errors_total", "Failed OpenWeatherMap requests by kind")
+OWM_RETRIES = Counter("cyclops_owm_retries_total", "OpenWeatherMap requests retried after a transient failure")
+CACHE_LOOKUPS = Counter("cyclops_cache_lookups_total", "Station values read by sessions, fresh (hit) or expired/missing (miss)")
+OBSERVATIONS = Counter("cyclops_observations_total", "Fetched observations that were new (changed) or repeats of the cached one (unchanged)")
+WS_BYTES = Counter("cyclops_websocket_bytes_total", "Estimated data source bytes pushed to browsers")
+
+
+def _hit_ratio():
+    hits, misses = CACHE_LOOKUPS.value(result="hit"), CACHE_LOOKUPS.value(result="miss")
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+CACHE_HIT_RATIO = Gauge("cyclops_cache_hit_ratio", "Share of station values read by sessions that were fresh", fn=_hit_ratio)
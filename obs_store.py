@@ -0,0 +1,130 @@
+"""Optional on-disk observation store for warm restarts and multi-process serving.
+
+When ``CYCLOPS_DB`` points at a file, the shared cache writes every
+observation through to this SQLite database and reloads it on startup. A
+redeployed server can then render the last known values immediately; the
+original fetch times are kept, so the cache TTL still decides what gets
+refetched.
+
+The database runs in WAL mode, so several server processes can use it at
+once: it also holds the poller lease and the stations each process's
+sessions display (see ``leader.py``).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class ObservationStore:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._inherited = []  # connections opened before a fork(): never used or closed again
+        # Tables are set up on a connection of their own, closed again at once:
+        # the store is created at import, before ``--num-procs`` forks
+        db = sqlite3.connect(path, isolation_level=None, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")  # persists in the file
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                " key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, obs TEXT NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS observations_fetched_at ON observations (fetched_at)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                " name TEXT PRIMARY KEY, holder TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS watched ("
+                " holder TEXT PRIMARY KEY, digest TEXT NOT NULL, keys TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+        finally:
+            db.close()
+
+    def _db(self):
+        # Under the lock. One connection per process, opened on first use. A
+        # SQLite connection must not be used across fork(), nor closed in the
+        # child - that drops the parent's file locks - so one inherited from
+        # before the fork (e.g. the warm-start load at import) is only parked
+        # where it will never be finalized
+        if self._pid != os.getpid():
+            if self._conn is not None:
+                self._inherited.append(self._conn)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._conn
+
+    def save(self, key, fetched_at, obs):
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO observations (key, fetched_at, obs) VALUES (?, ?, ?)",
+                (key, fetched_at, json.dumps(obs)),
+            )
+
+    def load(self, max_age=None, now=None):
+        """Yield ``(key, fetched_at, obs)``, skipping rows older than ``max_age``."""
+        now = time.time() if now is None else now
+        return self.load_since(-1.0 if max_age is None else now - max_age)
+
+    def load_since(self, t):
+        """Yield ``(key, fetched_at, obs)`` for rows fetched after ``t``, oldest first."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT key, fetched_at, obs FROM observations WHERE fetched_at > ? ORDER BY fetched_at", (t,)
+            ).fetchall()
+        for key, fetched_at, obs in rows:
+            yield key, fetched_at, json.loads(obs)
+
+    # -- Leases: at most one holder per name until it stops renewing
+    def acquire_lease(self, name, holder, ttl, now=None):
+        """Take or renew lease ``name`` for ``ttl`` seconds; ``True`` if ``holder`` has it."""
+        now = time.time() if now is None else now
+        with self._lock:
+            db = self._db()
+            # One statement, so two processes cannot both win
+            db.execute(
+                "INSERT INTO leases (name, holder, expires) VALUES (?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, expires = excluded.expires"
+                " WHERE leases.holder = excluded.holder OR leases.expires < ?",
+                (name, holder, now + ttl, now),
+            )
+            row = db.execute("SELECT holder FROM leases WHERE name = ?", (name,)).fetchone()
+        return row is not None and row[0] == holder
+
+    def release_lease(self, name, holder):
+        with self._lock:
+            self._db().execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+
+    # -- Stations each process's sessions display
+    def save_watched(self, holder, digest, keys, now=None):
+        """Record ``keys`` for ``holder``; only the timestamp is rewritten while ``digest`` is unchanged."""
+        now = time.time() if now is None else now
+        with self._lock:
+            db = self._db()
+            cur = db.execute("UPDATE watched SET updated = ? WHERE holder = ? AND digest = ?", (now, holder, digest))
+            if cur.rowcount == 0:
+                db.execute(
+                    "INSERT OR REPLACE INTO watched (holder, digest, keys, updated) VALUES (?, ?, ?, ?)",
+                    (holder, digest, json.dumps(sorted(keys)), now),
+                )
+
+    def watched_digests(self, since):
+        """``{holder: digest}`` of the watch lists updated after ``since``."""
+        with self._lock:
+            return dict(self._db().execute("SELECT holder, digest FROM watched WHERE updated > ?", (since,)))
+
+    def load_watched(self, holder):
+        with self._lock:
+            row = self._db().execute("SELECT keys FROM watched WHERE holder = ?", (holder,)).fetchone()
+        return set() if row is None else set(json.loads(row[0]))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
@@ -0,0 +1,173 @@
+"""Local stand-in for the OpenWeatherMap current-weather API.
+
+Serves ``/data/2.5/weather?lat=..&lon=..`` and ``/data/2.5/group?id=..`` with
+deterministic fake observations, so the fetcher (including ``/group``
+batching) can be exercised without network access or an API key::
+
+    python owm_stub.py --port 8085
+    CYCLOPS_OWM_URL=http://127.0.0.1:8085/data/2.5 bokeh serve --show Cyclops.py
+
+``GET /stats`` returns how many calls each endpoint has served. For load
+tests the stub can misbehave like the real service: ``--latency`` and
+``--jitter`` delay every API response, ``--error-rate`` answers a share of
+calls with HTTP 500 and ``--rate-limit`` answers calls beyond N per minute
+with HTTP 429.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+GROUP_LIMIT = 20
+
+
+class StubState:
+    """City registry and call counters shared by all handler threads."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=0, seed=None):
+        self.lock = threading.Lock()
+        self.cities = {}  # owm id -> (lat, lon)
+        self._ids = {}  # rounded (lat, lon) -> owm id
+        self.calls = {"weather": 0, "group": 0, "group_ids": 0, "errors": 0, "rate_limited": 0}
+        self.latency = latency  # seconds added to every API response
+        self.jitter = jitter  # plus up to this many seconds, uniformly random
+        self.error_rate = error_rate  # share of calls answered with HTTP 500
+        self.rate_limit = rate_limit  # calls per minute before HTTP 429, 0 = unlimited
+        self._recent = deque()  # monotonic times of accepted calls in the last minute
+        self._random = random.Random(seed)
+
+    def admit(self):
+        """Apply the rate limit, delay and error rate to one API call.
+
+        Returns an HTTP error status to answer with, or ``None`` to serve it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            if self.rate_limit and len(self._recent) >= self.rate_limit:
+                self.calls["rate_limited"] += 1
+                return 429
+            self._recent.append(now)
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            with self.lock:
+                self.calls["errors"] += 1
+            return 500
+        return None
+
+    def city_id(self, lat, lon):
+        key = (round(lat, 2), round(lon, 2))
+        with self.lock:
+            if key not in self._ids:
+                self._ids[key] = 1000 + len(self._ids)
+                self.cities[self._ids[key]] = (lat, lon)
+            return self._ids[key]
+
+    def count(self, endpoint, n=1):
+        with self.lock:
+            self.calls[endpoint] += n
+
+    def observation(self, owm_id, now=None):
+        lat, lon = self.cities[owm_id]
+        now = time.time() if now is None else now
+        dt = int(now // 600 * 600)  # OWM refreshes roughly every 10 minutes
+        phase = math.sin(dt / 3600.0 + lon / 15.0)
+        return {
+            "id": owm_id,
+            "coord": {"lat": lat, "lon": lon},
+            "dt": dt,
+            "clouds": {"all": int(abs(lat * 7 + lon * 3)) % 101},
+            "main": {
+                "temp": round(30 - abs(lat) * 0.6 + 4 * phase, 2),
+                "humidity": int(50 + 30 * math.cos(math.radians(lat + lon))),
+                "pressure": int(1013 + 10 * phase),
+            },
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state = None  # set by make_server()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        qs = parse_qs(url.query)
+        if url.path.endswith(("/weather", "/group")):
+            status = self.state.admit()
+            if status == 429:
+                return self._send(429, {"cod": 429, "message": "Your account is temporary blocked due to exceeding of requests limitation"})
+            if status is not None:
+                return self._send(status, {"cod": str(status), "message": "Internal error"})
+        if url.path.endswith("/weather"):
+            try:
+                lat, lon = float(qs["lat"][0]), float(qs["lon"][0])
+            except (KeyError, ValueError):
+                return self._send(400, {"cod": "400", "message": "Nothing to geocode"})
+            self.state.count("weather")
+            return self._send(200, self.state.observation(self.state.city_id(lat, lon)))
+        if url.path.endswith("/group"):
+            ids = [int(i) for i in qs.get("id", [""])[0].split(",") if i]
+            if not ids or len(ids) > GROUP_LIMIT:
+                return self._send(400, {"cod": "400", "message": "Bad id list"})
+            self.state.count("group")
+            self.state.count("group_ids", len(ids))
+            items = [self.state.observation(i) for i in ids if i in self.state.cities]
+            return self._send(200, {"cnt": len(items), "list": items})
+        if url.path == "/stats":
+            with self.state.lock:
+                return self._send(200, dict(self.state.calls))
+        self._send(404, {"cod": "404", "message": "Not found"})
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=0, **behaviour):
+    """Build a stub server; ``port=0`` picks a free port.
+
+    ``behaviour`` is passed to ``StubState`` (latency, jitter, error_rate,
+    rate_limit, seed).
+    """
+    handler = type("Handler", (StubHandler,), {"state": StubState(**behaviour)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(host="127.0.0.1", port=0, **behaviour):
+    """Serve from a daemon thread; returns ``(server, base_url)``."""
+    server = make_server(host, port, **behaviour)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/data/2.5"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of calls answered with HTTP 500")
+    parser.add_argument("--rate-limit", type=int, default=0, help="calls per minute before HTTP 429 (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    server = make_server(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                         error_rate=args.error_rate, rate_limit=args.rate_limit, seed=args.seed)
+    print(f"OWM stub on http://{args.host}:{server.server_address[1]}/data/2.5")
+    server.serve_forever()
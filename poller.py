@@ -0,0 +1,165 @@
+"""One background poller per process, fanning updates out to sessions.
+
+A daemon thread drives ``SCHEDULER.tick()`` every ``CYCLOPS_POLL_INTERVAL``
+seconds, so upstream traffic depends on how many stations are due, not on
+how many browser tabs are open. Every cache write is noted; a few times a
+second the poller tells each subscribed session which of its regions'
+stations changed. Sessions subscribe to the regions they display and get
+called on the event loop they subscribed from, not on the poller thread:
+Bokeh's ``curdoc()`` is process-wide, and even ``doc.add_next_tick_callback``
+sets it for a moment, so touching a document from another thread can hand
+it to a session being created at the same time. The callback still runs
+outside the document lock and must go through ``doc.add_next_tick_callback``.
+
+``serve.py`` starts the poller from a server lifecycle hook; under plain
+``bokeh serve`` the first session starts it. When several processes share
+``CYCLOPS_DB``, only the one holding the lease ticks its scheduler; the
+others read what it fetched from the store (see ``leader.py``).
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+
+from leader import COORDINATOR
+from metrics import SESSIONS
+from regions import station_catalog
+from scheduler import SCHEDULER
+from weather_cache import CACHE
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL_S = float(os.getenv("CYCLOPS_POLL_INTERVAL", 2))
+# Changes are batched for this long before sessions hear about them
+PUBLISH_INTERVAL_S = 0.5
+
+
+class Poller:
+    def __init__(self, scheduler=SCHEDULER, cache=CACHE, interval=POLL_INTERVAL_S, catalog=station_catalog,
+                 coordinator=COORDINATOR):
+        self.scheduler = scheduler
+        self.coordinator = coordinator
+        self.interval = interval
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._subscribers = {}  # token (e.g. a Document) -> (regions, callback, event loop or None)
+        self._pending = set()  # keys written since the last publish
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._poke = False
+        self._thread = None
+        cache.add_listener(self._on_put)
+
+    def start(self):
+        """Start the polling thread; a no-op while it is running.
+
+        The catalog's stations are registered with the scheduler first: the
+        process may take the poller lease (``leader.py``) before it serves any
+        session, and must still fetch what the other processes' sessions show.
+        """
+        self.scheduler.add_catalog(self.catalog())
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="cyclops-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.coordinator is not None:
+            self.coordinator.release()
+
+    def subscribe(self, token, regions, callback):
+        """Call ``callback(keys)`` when stations of ``regions`` change.
+
+        The call is made on the event loop running ``subscribe()``, or from the
+        poller thread when there is none (e.g. ``benchmark.py``). Subscribing
+        again with the same ``token`` replaces its regions and callback.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            self._subscribers[token] = (frozenset(regions), callback, loop)
+
+    def unsubscribe(self, token):
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def poke(self):
+        """Tick as soon as possible, e.g. after a session switched region."""
+        self._poke = True
+        self._wake.set()
+
+    def _on_put(self, key, obs, fetched_at):
+        with self._lock:
+            self._pending.add(key)
+
+    def _publish(self):
+        with self._lock:
+            changed, self._pending = self._pending, set()
+            subscribers = list(self._subscribers.values())
+        if not changed or not subscribers:
+            return
+        # A station may belong to several regions; match its bitmask against each subscriber's
+        catalog = self.catalog()
+        changed = [key for key in changed if key in catalog]
+        masks = catalog.region_mask[catalog.rows(changed)]
+        for regions, callback, loop in subscribers:
+            hits = np.flatnonzero(masks & catalog.regions_mask(regions))
+            if not len(hits):
+                continue
+            keys = [changed[i] for i in hits]
+            if loop is None:
+                self._deliver(callback, keys)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._deliver, callback, keys)
+            except RuntimeError:  # the loop is closed: the server is shutting down
+                pass
+
+    @staticmethod
+    def _deliver(callback, keys):
+        try:
+            callback(keys)
+        except Exception:
+            log.exception("poller: subscriber callback failed")
+
+    def _run(self):
+        next_tick = 0.0
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if self._poke or now >= next_tick:
+                self._poke = False
+                next_tick = now + self.interval
+                try:
+                    if self.coordinator is None or self.coordinator.lead():
+                        self.scheduler.tick()
+                except Exception:
+                    log.exception("poller: scheduler tick failed")
+            self._publish()
+            self._wake.wait(min(PUBLISH_INTERVAL_S, max(0.0, next_tick - time.monotonic())))
+            self._wake.clear()
+
+
+# One poller per server process
+POLLER = Poller()
+
+
+def forget_session(doc, session_context):
+    """``on_session_destroyed`` cleanup for the session owning ``doc``.
+
+    Defined here because Bokeh empties the session's ``Cyclops.py`` namespace
+    before calling the hook.
+    """
+    POLLER.unsubscribe(doc)
+    SCHEDULER.unwatch(doc)
+    SESSIONS.dec()
@@ -0,0 +1,276 @@
+"""Quota-aware refresh scheduler.
+
+Instead of every session firing a burst of requests once a minute, a single
+process-wide scheduler holds a token bucket sized to the OpenWeatherMap plan
+(``CYCLOPS_REQUEST_BUDGET`` calls per minute) and hands out requests a few at
+a time, so refreshes are spread evenly over the minute. Stations that some
+session is looking at are refreshed first; every other known station only
+gets whatever budget is left over. Sessions register the area they display
+(a region and the grid cells around their view), not its station keys.
+"""
+import heapq
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from fetcher import ENGINE, GROUP_SIZE
+from metrics import Gauge
+from weather_cache import CACHE
+
+log = logging.getLogger(__name__)
+
+REQUEST_BUDGET_PER_MIN = float(os.getenv("CYCLOPS_REQUEST_BUDGET", 60))
+# Largest burst allowed, in seconds of budget
+BURST_S = 5.0
+# Stations handed to the engine are looked at again after this long
+RECHECK_S = 5.0
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def take(self, n=1):
+        """Spend ``n`` tokens if available; never blocks."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens < n:
+                return False
+            self.tokens -= n
+            return True
+
+    def available(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return self.tokens
+
+
+class RemoteWatcher(str):
+    """Watcher token standing for the sessions of another server process."""
+
+
+class RefreshScheduler:
+    """Hands due stations to the engine within the request budget.
+
+    Every known station sits in a heap ordered by the time it is next due, so
+    a tick only pops as many stations as the budget can pay for instead of
+    looking at all of them. Heap times are estimates that never run later
+    than the cache's: each popped station is checked against
+    ``cache.due_times`` and pushed back if it is not actually due yet.
+    """
+
+    def __init__(self, engine=ENGINE, cache=CACHE, budget_per_min=REQUEST_BUDGET_PER_MIN):
+        self.engine = engine
+        self.cache = cache
+        self.budget_per_min = budget_per_min
+        rate = budget_per_min / 60.0
+        self.bucket = TokenBucket(rate, max(1.0, rate * BURST_S))
+        engine.budget = self.bucket  # the engine's retries are requests too
+        self._lock = threading.Lock()
+        self._stations = {}  # key -> city, every station known to the process
+        self._due = {}  # key -> estimated due time, the live entry in _heap
+        self._heap = []  # (due, key); entries disagreeing with _due are stale
+        self._watchers = {}  # watcher -> set of keys, or (catalog, region, cells) area, it displays
+        self._watched = None  # (_watch_gen, union of the watchers' keys) of the last expansion
+        self._watch_gen = 0  # bumped on every change of _watchers
+        self._spent = deque()  # monotonic times of requests in the last minute
+        self._catalogs = []  # catalogs already registered via add_catalog()
+
+    def add_stations(self, stations):
+        """Make ``(key, city)`` pairs known for background refreshes."""
+        stations = dict(stations)
+        with self._lock:
+            new = [k for k in stations if k not in self._stations]
+            self._stations.update(stations)
+        self._schedule(zip(new, self.cache.due_times(new)))
+
+    def _schedule(self, entries):
+        """Put ``(key, due)`` pairs (back) on the heap."""
+        with self._lock:
+            for key, due in entries:
+                self._due[key] = due
+                heapq.heappush(self._heap, (due, key))
+            if len(self._heap) > 2 * len(self._due) + 64:
+                # Drop stale entries left behind by rescheduling
+                self._heap = [(d, k) for k, d in self._due.items()]
+                heapq.heapify(self._heap)
+
+    def add_catalog(self, catalog):
+        """Make every station of a ``StationCatalog`` known, once per catalog."""
+        with self._lock:
+            if any(c is catalog for c in self._catalogs):
+                return
+            self._catalogs.append(catalog)
+        self.add_stations((sid, catalog.station(sid)) for sid in catalog.ids)
+
+    def watch(self, watcher, keys):
+        """``watcher`` (e.g. another process, see ``leader.py``) displays ``keys``; they go first."""
+        with self._lock:
+            self._watchers[watcher] = set(keys)
+            self._watch_gen += 1
+
+    def watch_area(self, watcher, catalog, region, bounds=None):
+        """``watcher`` (e.g. a session) displays ``region`` of ``catalog`` within Mercator ``bounds``.
+
+        Only the range of ``GridIndex`` cells covering ``bounds`` (the whole
+        region for ``None``) is kept, so a watcher costs a few numbers however
+        many stations it shows. The stations of every area go first; they are
+        looked up once after a change, not once per session.
+        """
+        area = (catalog, region, None if bounds is None else catalog.region_index(region).cells(*bounds))
+        with self._lock:
+            if self._watchers.get(watcher) != area:
+                self._watchers[watcher] = area
+                self._watch_gen += 1
+
+    def unwatch(self, watcher):
+        with self._lock:
+            if self._watchers.pop(watcher, None) is not None:
+                self._watch_gen += 1
+
+    @staticmethod
+    def _expand(watches):
+        """Union of the keys of ``watches``: key sets and ``(catalog, region, cells)`` areas."""
+        keys, areas = set(), {}
+        for watch in watches:
+            if isinstance(watch, tuple):
+                areas.setdefault(watch[0], set()).add(watch[1:])
+            else:
+                keys |= watch
+        for catalog, regions in areas.items():
+            rows = [catalog.region_rows(region) if cells is None
+                    else catalog.region_rows(region)[catalog.region_index(region).query_cells(*cells)]
+                    for region, cells in regions]
+            keys.update(catalog.ids[i] for i in np.unique(np.concatenate(rows)))
+        return keys
+
+    def watched(self, local_only=False):
+        """Keys any watcher displays; ``local_only`` leaves out other processes' (see ``leader.py``).
+
+        The result is shared between calls: do not modify it.
+        """
+        with self._lock:
+            if not local_only and self._watched is not None and self._watched[0] == self._watch_gen:
+                return self._watched[1]
+            gen = self._watch_gen
+            watches = [keys for w, keys in self._watchers.items() if not (local_only and isinstance(w, RemoteWatcher))]
+        keys = frozenset(self._expand(watches))
+        if not local_only:
+            with self._lock:
+                self._watched = (gen, keys)
+        return keys
+
+    def resync(self):
+        """Re-read every station's due time from the cache.
+
+        For a process taking over the fetching (see ``leader.py``): its heap
+        still holds the due times from before others filled its cache.
+        """
+        with self._lock:
+            keys = list(self._stations)
+        due = self.cache.due_times(keys)
+        with self._lock:
+            self._due.update(zip(keys, due))
+            self._heap = [(d, k) for k, d in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def _watched_due(self, now):
+        """Expired watched stations, oldest first."""
+        watched = self.watched()
+        with self._lock:
+            keys = [k for k in watched if k in self._stations]
+        expired = sorted((due, k) for k, due in zip(keys, self.cache.due_times(keys)) if due <= now)
+        return watched, [k for _, k in expired]
+
+    def _pop_due(self, now, batches, watched):
+        """Pop background stations off the heap until they fill ``batches`` requests."""
+        picked, grouped, single = [], 0, 0
+        while -(-grouped // GROUP_SIZE) + single < batches:
+            with self._lock:
+                keys = []
+                while self._heap and self._heap[0][0] <= now and len(keys) < GROUP_SIZE:
+                    due, key = heapq.heappop(self._heap)
+                    if self._due.get(key) == due:
+                        keys.append(key)
+            if not keys:
+                break
+            for key, due in zip(keys, self.cache.due_times(keys)):
+                if due > now or key in watched or -(-grouped // GROUP_SIZE) + single >= batches:
+                    # Not due after all, over budget, or handled with the
+                    # watched stations: back on the heap
+                    self._schedule([(key, now + RECHECK_S if key in watched else due)])
+                    continue
+                picked.append(key)
+                if self.engine.owm_id(key, self._stations[key]):
+                    grouped += 1
+                else:
+                    single += 1
+        return picked
+
+    def tick(self):
+        """Submit as many due requests as the budget allows right now."""
+        breaker = self.engine.breaker.state()
+        if breaker == "open":  # upstream is failing: keep serving last known values
+            return 0
+        now = time.time()
+        budget = int(self.bucket.available())
+        if breaker == "half_open":  # one probe decides whether to resume
+            budget = min(budget, 1)
+        if budget < 1:
+            return 0
+        watched, first = self._watched_due(now)
+        batches = self.engine.plan((k, self._stations[k]) for k in first)[:budget]
+        rest = self._pop_due(now, budget - len(batches), watched)
+        batches += self.engine.plan((k, self._stations[k]) for k in rest)
+        sent = 0
+        for batch in batches:
+            if not self.bucket.take():
+                break
+            if self.engine.submit_batch(batch) is not None:
+                sent += 1
+        # Sent, in flight or left over: look again once the fetch had time to land
+        self._schedule((key, now + RECHECK_S) for key in first + rest)
+        now = time.monotonic()
+        with self._lock:
+            self._spent.extend([now] * sent)
+            while self._spent and now - self._spent[0] > 60:
+                self._spent.popleft()
+        if sent:
+            log.debug("scheduler: %d requests sent", sent)
+        return sent
+
+    def stats(self):
+        """Queue depth (stations waiting for budget) and budget use."""
+        now = time.monotonic()
+        wall = time.time()
+        with self._lock:
+            used = sum(1 for t in self._spent if now - t <= 60)
+            return dict(
+                queue_depth=sum(1 for due in self._due.values() if due <= wall),
+                watchers=len(self._watchers),
+                stations=len(self._stations),
+                budget_per_min=self.budget_per_min,
+                used_last_min=used,
+                budget_used=used / self.budget_per_min if self.budget_per_min else 0.0,
+                tokens=self.bucket.available(),
+            )
+
+
+# One scheduler (and one request budget) per server process
+SCHEDULER = RefreshScheduler()
+Gauge("cyclops_scheduler_queue_depth", "Stations overdue for a refresh",
+      fn=lambda: SCHEDULER.stats()["queue_depth"])
+Gauge("cyclops_scheduler_budget_used", "Share of the per-minute request budget spent in the last minute",
+      fn=lambda: SCHEDULER.stats()["budget_used"])
@@ -0,0 +1,73 @@
+"""Run Cyclops on an embedded Bokeh server with a Prometheus ``/metrics`` endpoint.
+
+``bokeh serve Cyclops.py`` has no way to add HTTP routes, so this launcher
+starts the same app programmatically and registers the metrics handler via
+``extra_patterns``. It also starts and stops the background poller
+(``poller.py``) from the server lifecycle hooks::
+
+    python serve.py --port 5006 --show
+    curl http://localhost:5006/metrics
+
+``--num-procs N`` forks N worker processes on the same port. They need a
+shared ``CYCLOPS_DB``, through which one of them polls for all (``leader.py``)::
+
+    CYCLOPS_DB=/data/observations.db python serve.py --num-procs 4
+"""
+import argparse
+import os
+
+from bokeh.application import Application
+from bokeh.application.handlers import ScriptHandler
+from bokeh.application.handlers.lifecycle import LifecycleHandler
+from bokeh.server.server import Server
+from tornado.web import RequestHandler
+
+import metrics
+from poller import POLLER
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Cyclops.py")
+
+
+class MetricsHandler(RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.write(metrics.render())
+
+
+class PollerHooks(LifecycleHandler):
+    """Runs the process-wide poller for as long as the server is up."""
+
+    def __init__(self):
+        super().__init__()
+        self._on_server_loaded = lambda server_context: POLLER.start()
+        self._on_server_unloaded = lambda server_context: POLLER.stop()
+
+
+def make_server(port=5006, address=None, allow_websocket_origin=None, num_procs=1):
+    app = Application(ScriptHandler(filename=APP_PATH), PollerHooks())
+    return Server(
+        {"/Cyclops": app},
+        port=port,
+        address=address,
+        allow_websocket_origin=allow_websocket_origin,
+        num_procs=num_procs,
+        extra_patterns=[(r"/metrics", MetricsHandler)],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Cyclops with a /metrics endpoint.")
+    parser.add_argument("--port", type=int, default=5006)
+    parser.add_argument("--address", default=None)
+    parser.add_argument("--allow-websocket-origin", action="append", default=None)
+    parser.add_argument("--show", action="store_true", help="open the app in a browser")
+    parser.add_argument("--num-procs", type=int, default=1, help="worker processes (needs CYCLOPS_DB)")
+    args = parser.parse_args()
+    if args.num_procs != 1 and not os.getenv("CYCLOPS_DB"):
+        parser.error("--num-procs needs CYCLOPS_DB: the workers share observations through it")
+
+    server = make_server(args.port, args.address, args.allow_websocket_origin, args.num_procs)
+    server.start()
+    if args.show:
+        server.io_loop.add_callback(server.show, "/Cyclops")
+    server.io_loop.start()
@@ -0,0 +1,100 @@
+"""Send only what changed when refreshing a ColumnDataSource.
+
+``source.data.update(...)`` re-serializes whole columns to every client even
+when most stations did not change. ``patch_columns`` diffs new values against
+the current columns and pushes just the changed rows with ``source.patch``.
+
+Numeric columns are expected as NumPy arrays: Bokeh sends those as binary
+buffers instead of JSON number lists, and they are diffed vectorized.
+"""
+import json
+import logging
+import math
+
+import numpy as np
+
+from metrics import WS_BYTES
+
+log = logging.getLogger(__name__)
+
+
+def _same(a, b):
+    if a == b:
+        return True
+    # NaN != NaN, but an unknown value that stays unknown is not a change
+    return isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b)
+
+
+def _changed_rows(old, new):
+    if isinstance(new, np.ndarray) and new.dtype.kind == "f":
+        old = np.asarray(old, dtype=new.dtype)
+        return np.flatnonzero(~((old == new) | (np.isnan(old) & np.isnan(new))))
+    return [i for i, (a, b) in enumerate(zip(old, new)) if not _same(a, b)]
+
+
+def _scalar(value):
+    # Patches go out as JSON: float32 as its shortest repr (23.45, not 23.450000762939453)
+    if isinstance(value, np.float32):
+        return float(str(value))
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _json_size(obj):
+    return len(json.dumps(obj, default=float))
+
+
+def _column_bytes(col):
+    if isinstance(col, np.ndarray) and col.dtype.kind in "fiub":
+        return col.nbytes
+    col = list(col)
+    if col and isinstance(col[0], np.ndarray):  # e.g. an image column
+        return sum(_column_bytes(c) for c in col)
+    return _json_size(col)
+
+
+def payload_bytes(columns):
+    """Rough wire size of ``columns``: raw buffer size for arrays, JSON otherwise."""
+    return sum(_column_bytes(col) for col in columns.values())
+
+
+def replace_data(source, data):
+    """Full ``source.data`` replacement, counted in the websocket bytes metric."""
+    source.data = data
+    WS_BYTES.inc(payload_bytes(data))
+
+
+def patch_columns(source, columns):
+    """Bring ``source`` up to date with ``columns`` (same rows, same order).
+
+    Columns where more than half the rows changed are replaced outright, since
+    ``(index, value)`` pairs would cost more than the column itself. Returns
+    ``{"rows", "changed", "full_bytes", "sent_bytes", "saved_bytes"}``.
+    """
+    patches, replace, changed_rows = {}, {}, set()
+    for name, new in columns.items():
+        if not isinstance(new, np.ndarray):
+            new = list(new)
+        changed = _changed_rows(source.data[name], new)
+        if not len(changed):
+            continue
+        changed_rows.update(changed)
+        if 2 * len(changed) > len(new):
+            replace[name] = new
+        else:
+            patches[name] = [(int(i), _scalar(new[i])) for i in changed]
+
+    full_bytes = payload_bytes(columns)
+    sent_bytes = (_json_size(patches) if patches else 0) + payload_bytes(replace)
+    if replace:
+        source.data.update(replace)
+    if patches:
+        source.patch(patches)
+    WS_BYTES.inc(sent_bytes)
+
+    stats = dict(
+        rows=len(next(iter(columns.values()), [])), changed=len(changed_rows),
+        full_bytes=full_bytes, sent_bytes=sent_bytes, saved_bytes=full_bytes - sent_bytes,
+    )
+    log.debug("source refresh: %(changed)d/%(rows)d rows changed, %(sent_bytes)d bytes sent, "
+              "%(saved_bytes)d bytes saved", stats)
+    return stats
@@ -0,0 +1,269 @@
+"""Deduplicated, columnar station table with O(1) lookups.
+
+Every physical station is one row, however many region lists include it.
+Two entries of the built-in region lists are the same station when their
+names agree - ignoring case, accents and a ``", <country>"`` suffix, so
+``"Athens"`` and ``"Athens, GR"`` match - and they lie within ``DEDUP_KM`` of
+each other. ``concat()`` matches stations across catalogs the same way, but
+never merges two rows of one catalog: an import lists distinct places, even
+where two of them share a name. Region membership
+is a bitmask column (bit ``i`` is ``region_names[i]``); ``region_rows()``
+turns it into an index array per region. Observations are keyed by the
+row's station ID, so each station is fetched and cached once.
+
+Station IDs are ``"<name>@<lat>,<lon>"`` unless the source provides one
+(e.g. GeoNames IDs); the old per-region form ``"<region>/<name>"`` still
+resolves through ``row()``/``station()``. Entries may carry an
+``"owm_id"`` (OpenWeatherMap city ID) so they can be fetched in batches.
+"""
+import unicodedata
+
+import numpy as np
+
+from geo import GridIndex, distance_km, latlon_to_mercator
+from lod import LODPyramid
+
+DEDUP_KM = 25.0
+MAX_REGIONS = 64  # bits in the region mask
+
+
+def name_key(name):
+    """What two spellings of one place have in common: ``"Athens, GR"`` -> ``"athens"``."""
+    base = unicodedata.normalize("NFKD", str(name).split(",", 1)[0])
+    return "".join(c for c in base if not unicodedata.combining(c)).strip().casefold()
+
+
+def station_id(name, lat, lon):
+    return f"{name}@{lat:.4f},{lon:.4f}"
+
+
+class _TableBuilder:
+    """Collects entries, merging the ones that are the same physical station."""
+
+    def __init__(self, dedup_km=DEDUP_KM):
+        self.dedup_km = dedup_km
+        self.region_names = []
+        self._bits = {}
+        self.ids, self.names, self.lat, self.lon, self.owm_ids, self.masks = [], [], [], [], [], []
+        self.aliases = {}  # extra ID -> row
+        self._rows_by_key = {}  # name_key -> rows
+
+    def bit(self, region):
+        if region not in self._bits:
+            if len(self.region_names) == MAX_REGIONS:
+                raise ValueError(f"at most {MAX_REGIONS} regions")
+            self._bits[region] = len(self.region_names)
+            self.region_names.append(region)
+        return 1 << self._bits[region]
+
+    def add(self, name, lat, lon, mask, owm_id=0, aliases=()):
+        key = name_key(name)
+        row = next((r for r in self._rows_by_key.get(key, ())
+                    if distance_km(lat, lon, self.lat[r], self.lon[r]) <= self.dedup_km), None)
+        if row is None:
+            row = len(self.ids)
+            self.ids.append(station_id(name, lat, lon))
+            self.names.append(name)
+            self.lat.append(lat)
+            self.lon.append(lon)
+            self.owm_ids.append(owm_id)
+            self.masks.append(mask)
+            self._rows_by_key.setdefault(key, []).append(row)
+        else:
+            self.masks[row] |= mask
+            self.owm_ids[row] = self.owm_ids[row] or owm_id
+            if len(name) > len(self.names[row]):  # keep the most descriptive spelling
+                self.names[row] = name
+        for alias in aliases:
+            if alias != self.ids[row]:
+                self.aliases[alias] = row
+        return row
+
+    def build(self):
+        aliases = {alias: self.ids[row] for alias, row in self.aliases.items()}
+        return StationCatalog(self.ids, self.names, self.lat, self.lon,
+                              np.asarray(self.masks, dtype=np.uint64), self.region_names, self.owm_ids, aliases)
+
+
+class StationCatalog:
+    def __init__(self, ids, names, lat, lon, region_mask, region_names, owm_ids=None, aliases=None):
+        self.ids = list(ids)
+        self.names = list(names)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.region_mask = np.asarray(region_mask, dtype=np.uint64)
+        self.region_names = list(region_names)
+        self.owm_ids = np.zeros(len(self.ids), dtype=np.int64) if owm_ids is None else np.asarray(owm_ids, dtype=np.int64)
+        # Projected once for the whole table
+        self.x, self.y = latlon_to_mercator(self.lat, self.lon)
+        self._bit_by_region = {region: np.uint64(1 << i) for i, region in enumerate(self.region_names)}
+        self._rows_by_region = {}
+        self._ids_by_region = {}
+        self._coords_by_region = {}
+        self._index_by_region = {}
+        self._lod_by_region = {}
+        # Hash indexes: ID (and alias) -> row, name -> rows
+        self._row_by_id = {sid: i for i, sid in enumerate(self.ids)}
+        self.aliases = dict(aliases or {})
+        for alias, sid in self.aliases.items():
+            self._row_by_id.setdefault(alias, self._row_by_id[sid])
+        self._rows_by_name = {}
+        for i, name in enumerate(self.names):
+            self._rows_by_name.setdefault(name_key(name), []).append(i)
+
+    @classmethod
+    def from_regions(cls, cities_by_region, dedup_km=DEDUP_KM):
+        """Build from ``{region_key: [{"name", "lat", "lon"}, ...]}``, merging repeated stations."""
+        builder = _TableBuilder(dedup_km)
+        for region, cities in cities_by_region.items():
+            bit = builder.bit(region)
+            for c in cities:
+                builder.add(c["name"], c["lat"], c["lon"], bit, owm_id=c.get("owm_id", 0),
+                            aliases=[f"{region}/{c['name']}"])
+        return builder.build()
+
+    @classmethod
+    def concat(cls, catalogs, dedup_km=DEDUP_KM):
+        """One catalog holding the stations of all ``catalogs``, merged across them.
+
+        A station of a later catalog is merged into the nearest station of an
+        earlier one with the same name within ``dedup_km``, one to one: the
+        earlier ID is kept and the later one becomes an alias.
+        """
+        catalogs = list(catalogs)
+        merged = catalogs[0]
+        for c in catalogs[1:]:
+            merged = merged._merge(c, dedup_km)
+        return merged
+
+    def _matches(self, other, dedup_km):
+        """``(rows, other_rows)``: stations of ``other`` paired with the same station here.
+
+        Candidates share a ``name_key`` and lie within ``dedup_km``; the
+        closest pairs win, so no row is paired twice.
+        """
+        rows, other_rows = [], []
+        for key in self._rows_by_name.keys() & other._rows_by_name.keys():
+            mine, theirs = self._rows_by_name[key], other._rows_by_name[key]
+            rows += [r for r in mine for _ in theirs]
+            other_rows += theirs * len(mine)
+        rows, other_rows = np.asarray(rows, dtype=np.intp), np.asarray(other_rows, dtype=np.intp)
+        dist = distance_km(self.lat[rows], self.lon[rows], other.lat[other_rows], other.lon[other_rows])
+        near = np.flatnonzero(dist <= dedup_km)
+        near = near[np.argsort(dist[near], kind="stable")]
+        for taken in (other_rows, rows):  # nearest first: drop pairs reusing a row
+            near = near[np.sort(np.unique(taken[near], return_index=True)[1])]
+        return rows[near], other_rows[near]
+
+    def _merge(self, other, dedup_km):
+        region_names = self.region_names + [r for r in other.region_names if r not in self._bit_by_region]
+        if len(region_names) > MAX_REGIONS:
+            raise ValueError(f"at most {MAX_REGIONS} regions")
+        bits = {region: np.uint64(1 << i) for i, region in enumerate(region_names)}
+        other_mask = np.zeros(len(other), dtype=np.uint64)
+        for i, region in enumerate(other.region_names):
+            other_mask[(other.region_mask >> np.uint64(i)) & np.uint64(1) == 1] |= bits[region]
+
+        rows, other_rows = self._matches(other, dedup_km)
+        mask = self.region_mask.copy()
+        mask[rows] |= other_mask[other_rows]
+        owm_ids = self.owm_ids.copy()
+        owm_ids[rows] = np.where(owm_ids[rows] != 0, owm_ids[rows], other.owm_ids[other_rows])
+        names = list(self.names)
+        merged_ids = {}  # ID in ``other`` -> ID kept
+        for r, o in zip(rows.tolist(), other_rows.tolist()):
+            if len(other.names[o]) > len(names[r]):  # keep the most descriptive spelling
+                names[r] = other.names[o]
+            merged_ids[other.ids[o]] = self.ids[r]
+        aliases = dict(self.aliases)
+        aliases.update((sid, kept) for sid, kept in merged_ids.items() if sid != kept)
+        for alias, sid in other.aliases.items():
+            aliases.setdefault(alias, merged_ids.get(sid, sid))
+
+        new = np.ones(len(other), dtype=bool)
+        new[other_rows] = False
+        new = np.flatnonzero(new)
+        return StationCatalog(
+            self.ids + [other.ids[i] for i in new], names + [other.names[i] for i in new],
+            np.concatenate([self.lat, other.lat[new]]), np.concatenate([self.lon, other.lon[new]]),
+            np.concatenate([mask, other_mask[new]]), region_names,
+            np.concatenate([owm_ids, other.owm_ids[new]]), aliases,
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, station_id):
+        return station_id in self._row_by_id
+
+    def row(self, station_id):
+        return self._row_by_id[station_id]
+
+    def rows(self, station_ids):
+        return np.fromiter((self._row_by_id[s] for s in station_ids), dtype=np.intp, count=len(station_ids))
+
+    def rows_by_name(self, name):
+        """Rows whose name matches ``name`` ignoring case, accents and a country suffix."""
+        return self._rows_by_name.get(name_key(name), [])
+
+    def regions_mask(self, regions):
+        """Bitmask covering ``regions``; unknown regions are ignored."""
+        mask = np.uint64(0)
+        for region in regions:
+            mask |= self._bit_by_region.get(region, np.uint64(0))
+        return mask
+
+    def station_regions(self, station_id):
+        mask = int(self.region_mask[self.row(station_id)])
+        return [region for i, region in enumerate(self.region_names) if mask >> i & 1]
+
+    def region_rows(self, region):
+        """Rows of the stations in ``region`` as an index array, cached per region."""
+        rows = self._rows_by_region.get(region)
+        if rows is None:
+            bit = self._bit_by_region.get(region)
+            rows = np.empty(0, dtype=np.intp) if bit is None else np.flatnonzero(self.region_mask & bit)
+            self._rows_by_region[region] = rows
+        return rows
+
+    def region_coords(self, region):
+        """Mercator ``(x, y)`` arrays of a region, cached per region."""
+        coords = self._coords_by_region.get(region)
+        if coords is None:
+            rows = self.region_rows(region)
+            coords = self._coords_by_region[region] = (self.x[rows], self.y[rows])
+        return coords
+
+    def region_index(self, region):
+        """Spatial index over a region's projected coordinates.
+
+        Query results are positions within the region, i.e. rows of
+        ``region_coords(region)`` and ``region_ids(region)``.
+        """
+        index = self._index_by_region.get(region)
+        if index is None:
+            index = self._index_by_region[region] = GridIndex(*self.region_coords(region))
+        return index
+
+    def region_lod(self, region):
+        """Clustering pyramid over a region's projected coordinates."""
+        lod = self._lod_by_region.get(region)
+        if lod is None:
+            lod = self._lod_by_region[region] = LODPyramid(*self.region_coords(region))
+        return lod
+
+    def region_ids(self, region):
+        ids = self._ids_by_region.get(region)
+        if ids is None:
+            ids = self._ids_by_region[region] = [self.ids[i] for i in self.region_rows(region)]
+        return ids
+
+    def station(self, station_id):
+        """Row as the ``{"name", "lat", "lon"}`` dict the fetcher expects."""
+        i = self._row_by_id.get(station_id)
+        if i is None:
+            return None
+        city = {"id": self.ids[i], "name": self.names[i], "lat": float(self.lat[i]), "lon": float(self.lon[i])}
+        if self.owm_ids[i]:
+            city["owm_id"] = int(self.owm_ids[i])
+        return city
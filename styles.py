@@ -0,0 +1,41 @@
+"""CSS and tooltip templates for the map UI.
+
+Plain strings, built once per process. Bokeh models cannot be shared
+between documents, so each session still wraps them in its own
+``InlineStyleSheet``/``HoverTool``, but the (large) text is not rebuilt.
+"""
+
+GLOBAL_CSS = """ html, body, .bk, .bk-root {background-color: #2F2F2F; margin: 0; padding: 0; height: 100%; color: white; font-family: 'Consolas', 'Courier New', monospace; } .bk { color: white; } .bk-input, .bk-btn, .bk-select, .bk-slider-title, .bk-headers, .bk-label, .bk-title, .bk-legend, .bk-axis-label { color: white !important; } .bk-input::placeholder { color: #aaaaaa !important; } """
+RADIO_CSS = """ /* Outer container */ :host { background: #2F2F2F !important; border-radius: 16px !important; padding: 0px 0px 0px 0px !important; max-width: 1600px !important; } /* Title */ :host .bk-input-group label, :host .bk-radiobuttongroup-title { color: #f59e0b !important; font-size: 1.16em !important; font-family: 'Fira Code', monospace; font-weight: bold !important; margin-bottom: 16px !important; text-shadow: 0 2px 10px #f59e0b99; letter-spacing: 0.5px; } /* Button group: wrap on small screens */ :host .bk-btn-group { display: flex !important; gap: 10px !important; flex-wrap: wrap !important; justify-content: flex-start; margin-bottom: 4px; } /* Each radio button - pill shape, full text, no ellipsis */ :host button.bk-btn { background: #23233c !important; color: #f9fafb !important; border: 2.5px solid #f59e0b !important; border-radius: 999px !important; padding: 0.7em 2.2em !important; min-width: 60px !important; font-size: 1.09em !important; font-family: 'Fira Code', monospace; font-weight: 600 !important; transition: border 0.13s, box-shadow 0.14s, color 0.12s, background 0.13s; box-shadow: 0 2px 10px #0002 !important; cursor: pointer !important; outline: none !important; white-space: nowrap !important; overflow: visible !important; text-overflow: unset !important; } /* Orange glow on hover */ :host button.bk-btn:hover:not(.bk-active) { border-color: #ffa733 !important; color: #ffa733 !important; box-shadow: 0 0 0 2px #ffa73399, 0 0 13px #ffa73388 !important; background: #2e2937 !important; } /* Red glow on active/focus */ :host button.bk-btn:focus, :host button.bk-btn.bk-active { border-color: #ff3049 !important; color: #ff3049 !important; background: #322d36 !important; box-shadow: 0 0 0 2px #ff304999, 0 0 19px #ff304988 !important; } /* Remove focus outline */ :host button.bk-btn:focus { outline: none !important; } """
+SLIDER_CSS = """ :host { color: #FFD700; margin-top: 6px; } .bk-slider-title { color: #FFD700; font-size: 15px; } """
+
+# Shows the tooltip of the first hovered glyph only (see Cyclops.py cusj())
+FIRST_HIT_JS = """
+    special_vars.indices = special_vars.indices.slice(0,1)
+    return special_vars.indices.includes(special_vars.index) ? " " : " hidden "
+    """
+
+
+def hovfun(tltl):
+    return """<div @hidden{custom} style="background-color: #2F2F2F; padding: 5px; border-radius: 15px; box-shadow: 0px 0px 5px rgba(0,0,0,0.3);">        
+    """+tltl+"""
+    </div> <style> :host { --tooltip-border: transparent;  /* Same border color used everywhere */ --tooltip-color: transparent; --tooltip-text: #2f2f2f;} </style> """
+
+STATION_TOOLTIP = hovfun("""
+      <div style='font-size:27px; color:#FFD700; font-weight:bold;'>@name</div>
+      <div style='font-size:23px; color:#FFFFFF;'>☁️ @cloud{0.0}%</div>
+      <div style='font-size:23px; color:#FFFFFF;'>🌡️ @temp{0.0}°C</div>
+      <div style='font-size:23px; color:#FFFFFF;'>💧 @humidity{0.0}%</div>
+      <div style='font-size:23px; color:#FFFFFF;'>🕛 @pressure{0.0}hPa</div>
+""")
+CLUSTER_TOOLTIP = hovfun("""
+      <div style='font-size:27px; color:#FFD700; font-weight:bold;'>@count stations</div>
+      <div style='font-size:23px; color:#FFFFFF;'>🌡️ @temp{0.0}°C mean</div>
+      <div style='font-size:23px; color:#FFFFFF;'>⬇️ @tmin{0.0}°C ⬆️ @tmax{0.0}°C</div>
+""")
+
+# Client-side regions (see regions.client_side_regions()): the view shows the
+# rows of the selected region; ``rows`` holds one index array per region button
+REGION_FILTER_JS = "return Array.from(rows[radio.active])"
+# The filter reads ``radio.active`` itself; this only tells the view to re-run it
+REGION_SWITCH_JS = "region_filter.change.emit()"
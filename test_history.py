@@ -0,0 +1,28 @@
+from history import FIELDS, ObservationHistory
+from weather_cache import ObservationCache
+
+
+def test_record_more_stations_than_initial_capacity():
+    history = ObservationHistory(retention_s=3600, step_s=600)
+    t = 1_700_000_000.0
+    keys = [f"s{i}" for i in range(1500)]
+    for i, key in enumerate(keys):
+        history.record(key, dict(temp=float(i)), t)
+    assert len(history.values) >= len(keys)
+    snap = history.snapshot(keys, t)
+    assert snap["temp"].tolist() == [float(i) for i in range(len(keys))]
+    assert set(snap) == set(FIELDS)
+
+
+def test_unchanged_observations_keep_slots_filled():
+    cache = ObservationCache()
+    history = ObservationHistory(retention_s=6 * 3600, step_s=600)
+    cache.add_listener(history.record, renewals=True)
+    t0 = 1_700_000_000.0
+    obs = dict(temp=12.0, dt=t0)  # the station never publishes anything newer
+    t = t0
+    while t < t0 + 4 * 3600:
+        cache.put("s", obs, t)
+        t = cache.due_times(["s"])[0]
+    for slot_t in range(int(t0), int(t0 + 4 * 3600), 600):
+        assert history.snapshot(["s"], slot_t)["temp"][0] == 12.0, slot_t
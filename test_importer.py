@@ -0,0 +1,22 @@
+import numpy as np
+
+from importer import region_masks
+
+CITIES = {
+    "Izmir": (38.42, 27.14, "TR", {"west_asia"}),
+    "Istanbul": (41.01, 28.98, "TR", {"west_asia"}),
+    "Tirana": (41.33, 19.82, "AL", {"europe"}),
+    "Athens": (37.98, 23.73, "GR", {"europe", "greece"}),
+    "Cairo": (30.04, 31.24, "EG", {"africa"}),
+    "Sana'a": (15.37, 44.19, "YE", {"west_asia"}),
+    "Tunis": (36.81, 10.18, "TN", {"africa"}),
+    "Lhasa": (29.65, 91.10, "CN", {"east_asia"}),
+    "Gangtok": (27.33, 88.61, "IN", {"south_asia"}),
+}
+
+
+def test_region_masks_follow_borders_and_country_codes():
+    lat, lon, country, expected = zip(*CITIES.values())
+    masks = region_masks(np.array(lat), np.array(lon), list(country))
+    for i, name in enumerate(CITIES):
+        assert {r for r, m in masks.items() if m[i]} == expected[i], name
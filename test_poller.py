@@ -0,0 +1,65 @@
+import time
+
+from fetcher import CircuitBreaker
+from leader import Coordinator
+from obs_store import ObservationStore
+from poller import Poller
+from scheduler import RefreshScheduler
+from stations import StationCatalog
+from weather_cache import ObservationCache
+
+
+class RecordingEngine:
+    def __init__(self):
+        self.breaker = CircuitBreaker()
+        self.sent = []
+
+    def owm_id(self, key, city):
+        return None
+
+    def plan(self, stations):
+        return [[station] for station in stations]
+
+    def submit_batch(self, batch):
+        self.sent += [key for key, _ in batch]
+        return True
+
+
+class Process(Coordinator):
+    """A coordinator standing for one of several server processes."""
+
+    def __init__(self, name, store, scheduler, cache):
+        super().__init__(store, scheduler, cache, ttl=60)
+        self.name = name
+
+    @property
+    def holder(self):
+        return self.name
+
+
+def test_lease_holder_with_no_sessions_fetches_what_followers_watch(tmp_path):
+    catalog = StationCatalog(["a", "b", "c"], ["A", "B", "C"], [10.0, 20.0, 30.0], [10.0, 20.0, 30.0],
+                             [1, 1, 1], ["globe"])
+    store = ObservationStore(str(tmp_path / "observations.db"))
+
+    engine, cache = RecordingEngine(), ObservationCache()
+    scheduler = RefreshScheduler(engine, cache, budget_per_min=600)
+    leader = Process("leader", store, scheduler, cache)
+    assert leader.lead()
+
+    follower_cache = ObservationCache()
+    follower_scheduler = RefreshScheduler(RecordingEngine(), follower_cache)
+    follower_scheduler.watch("session", ["b"])
+    assert not Process("follower", store, follower_scheduler, follower_cache).lead()
+
+    # The leader never had a session, so nothing but the poller told its scheduler about the stations
+    poller = Poller(scheduler, cache, interval=0.05, catalog=lambda: catalog, coordinator=leader)
+    poller.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not engine.sent and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        poller.stop()
+    assert engine.sent[0] == "b"
+    assert set(engine.sent) == {"a", "b", "c"}
@@ -0,0 +1,203 @@
+"""Process-wide observation cache shared by every Bokeh session.
+
+Bokeh re-executes ``Cyclops.py`` for each browser tab, but regular imports are
+cached in ``sys.modules``, so anything defined here exists once per server
+process. Sessions read observations from ``CACHE`` and only hit
+OpenWeatherMap for stations whose entry has expired.
+
+Each station is refetched on its own schedule. A response whose
+observation time (OWM ``dt``) did not move is not a change: it renews the
+entry but bumps no version and notifies no listener, so nothing is pushed
+to browsers. The next refresh is planned from how often the station's
+``dt`` actually advances (about every 10 minutes for most stations), and
+backs off while it keeps coming back unchanged, never checking more often
+than ``CYCLOPS_CACHE_TTL`` nor less often than ``CYCLOPS_MAX_REFRESH``.
+
+Set ``CYCLOPS_DB`` to a file path to write observations through to an
+on-disk store (``obs_store.py``) and start warm after a restart. Server
+processes sharing that file also share observations: only one of them
+fetches (see ``leader.py``).
+"""
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from metrics import CACHE_LOOKUPS, OBSERVATIONS
+
+# Shortest gap between two fetches of one station
+CACHE_TTL_S = float(os.getenv("CYCLOPS_CACHE_TTL", 60))
+# Longest gap between two fetches of one station
+MAX_REFRESH_S = float(os.getenv("CYCLOPS_MAX_REFRESH", 1800))
+# First guess of how often a station's observation changes, refined per station
+OBS_INTERVAL_S = 600.0
+# OWM publishes an observation a little after its ``dt``
+PUBLISH_LAG_S = 60.0
+# Older than this, a last known value is still shown but marked stale
+STALE_AFTER_S = float(os.getenv("CYCLOPS_STALE_AFTER", 600))
+DB_PATH = os.getenv("CYCLOPS_DB")
+# Rows older than this are not worth reloading after a restart
+DB_MAX_AGE_S = float(os.getenv("CYCLOPS_DB_MAX_AGE", 24 * 3600))
+
+
+def _obs_time(obs):
+    dt = None if obs is None else obs.get("dt")
+    return None if dt is None or (isinstance(dt, float) and math.isnan(dt)) else dt
+
+
+def same_observation(a, b):
+    """Whether ``b`` is the same observation as ``a``: same ``dt``, or same values without one."""
+    if a is None or b is None:
+        return False
+    dt_a, dt_b = _obs_time(a), _obs_time(b)
+    if dt_a is not None and dt_b is not None:
+        return dt_a == dt_b
+    return a.keys() == b.keys() and all(
+        a[k] == b[k] or (isinstance(a[k], float) and isinstance(b[k], float) and math.isnan(a[k]) and math.isnan(b[k]))
+        for k in a)
+
+
+class ObservationCache:
+    """Thread-safe ``station key -> observation`` mapping with per-station refresh times."""
+
+    def __init__(self, ttl=CACHE_TTL_S, store=None, max_refresh=MAX_REFRESH_S):
+        self.ttl = ttl
+        self.max_refresh = max_refresh
+        self.store = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (fetched_at, obs)
+        self._due = {}  # key -> time the next fetch is worth making
+        self._rhythm = {}  # key -> (estimated seconds between observations, unchanged fetches in a row)
+        self.version = 0  # bumped on every write, lets readers skip no-op refreshes
+        if store is not None:
+            self.attach_store(store)
+
+    def attach_store(self, store, max_age=DB_MAX_AGE_S):
+        """Load what ``store`` remembers and write through to it from now on.
+
+        Entries keep their original fetch time, so expired ones are shown as
+        last known values but still refetched.
+        """
+        with self._lock:
+            for key, fetched_at, obs in store.load(max_age):
+                self._entries[key] = (fetched_at, obs)
+                self._due[key] = fetched_at + self.ttl
+            self.version += 1
+            self.store = store
+
+    def add_listener(self, fn, renewals=False):
+        """Call ``fn(key, obs, fetched_at)`` after every write of a new observation.
+
+        With ``renewals``, also after a fetch that returned the cached observation again.
+        """
+        self._listeners.append((fn, renewals))
+
+    def lookup_columns(self, keys, fields, now=None, dtype=np.float32):
+        """Last known values of many keys under one lock, as columns; counts cache hits for metrics.
+
+        Returns ``({field: array}, age array)``: one contiguous ``dtype`` array
+        per field (NaN where never fetched) and ages in seconds (inf likewise).
+        """
+        now = time.time() if now is None else now
+        values = np.full((len(fields), len(keys)), np.nan, dtype=dtype)
+        fetched_at = np.full(len(keys), -np.inf)
+        with self._lock:
+            entries = [self._entries.get(k) for k in keys]
+            hits = sum(1 for k in keys if now < self._due.get(k, 0.0))
+        known = [i for i, e in enumerate(entries) if e is not None]
+        if known:
+            values[:, known] = np.array([[entries[i][1].get(f) for f in fields] for i in known], dtype=dtype).T
+            fetched_at[known] = [entries[i][0] for i in known]
+        CACHE_LOOKUPS.inc(hits, result="hit")
+        CACHE_LOOKUPS.inc(len(keys) - hits, result="miss")
+        return dict(zip(fields, values)), now - fetched_at
+
+    def _plan_refresh(self, key, prev, obs, now):
+        # Under the lock: when to fetch ``key`` next; returns whether ``obs`` is new
+        interval, unchanged = self._rhythm.get(key, (OBS_INTERVAL_S, 0))
+        changed = not same_observation(prev, obs)
+        dt, prev_dt = _obs_time(obs), _obs_time(prev)
+        if changed:
+            if dt is not None and prev_dt is not None and dt > prev_dt:
+                # Smoothed gap between observations
+                interval = min(self.max_refresh, max(self.ttl, 0.5 * interval + 0.5 * (dt - prev_dt)))
+            unchanged = 0
+        else:
+            unchanged += 1
+        if dt is None:
+            due = now + self.ttl
+        elif changed:  # nothing new before the next observation is published
+            due = max(now + self.ttl, dt + interval + PUBLISH_LAG_S)
+        else:  # late: look again soon, then less and less often
+            due = now + min(interval, self.ttl * 2 ** (unchanged - 1))
+        self._rhythm[key] = (interval, unchanged)
+        self._due[key] = min(due, now + self.max_refresh)
+        return changed
+
+    def put(self, key, obs, now=None):
+        """Store a fetched observation; returns ``False`` if it was the one already cached.
+
+        An unchanged observation only renews the entry: no version bump, and only
+        listeners registered for renewals hear about it.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            changed = self._plan_refresh(key, self._entries.get(key, (None, None))[1], obs, now)
+            self._entries[key] = (now, obs)
+            if changed:
+                self.version += 1
+        OBSERVATIONS.inc(result="changed" if changed else "unchanged")
+        if self.store is not None:
+            self.store.save(key, now, obs)
+        for fn, renewals in self._listeners:
+            if changed or renewals:
+                fn(key, obs, now)
+        return changed
+
+    def ingest(self, rows):
+        """Apply ``(key, fetched_at, obs)`` rows another process fetched (see ``leader.py``).
+
+        Like ``put()``, but keeps their fetch time, skips rows no newer than
+        the cached entry and writes nothing back to the store. Returns how
+        many observations were new.
+        """
+        applied = []
+        with self._lock:
+            for key, fetched_at, obs in rows:
+                prev = self._entries.get(key)
+                if prev is not None and prev[0] >= fetched_at:
+                    continue
+                changed = self._plan_refresh(key, None if prev is None else prev[1], obs, fetched_at)
+                self._entries[key] = (fetched_at, obs)
+                if changed:
+                    self.version += 1
+                applied.append((key, obs, fetched_at, changed))
+        for key, obs, fetched_at, changed in applied:
+            for fn, renewals in self._listeners:
+                if changed or renewals:
+                    fn(key, obs, fetched_at)
+        return sum(1 for *_, changed in applied if changed)
+
+    def expired(self, keys, now=None):
+        """Keys out of ``keys`` that need fetching again."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return [k for k in keys if now >= self._due.get(k, 0.0)]
+
+    def due_times(self, keys):
+        """When each of ``keys`` next needs fetching; ``-inf`` if never fetched."""
+        with self._lock:
+            return [self._due.get(k, float("-inf")) for k in keys]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# One cache per server process, shared by all sessions
+CACHE = ObservationCache()
+if DB_PATH:
+    from obs_store import ObservationStore
+    CACHE.attach_store(ObservationStore(DB_PATH))